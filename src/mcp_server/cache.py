@@ -4,12 +4,15 @@ This module provides caching capabilities with LRU eviction, TTL support,
 and cache statistics tracking.
 """
 
-import hashlib
+import heapq
+import os
 import time
 from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from pptx import Presentation
 
@@ -17,6 +20,30 @@ from .config import get_config
 from .interfaces import ICache
 
 
+@dataclass(slots=True)
+class _CacheEntry:
+    """Value stored in LRUCache with its optional absolute expiry time."""
+
+    value: Any
+    expires_at: Optional[float]
+
+
+@dataclass(slots=True)
+class _Shard:
+    """One lock-guarded partition of an LRUCache."""
+
+    lock: Lock = field(default_factory=Lock)
+    # Guards ``misses`` so lock-free misses in get() don't contend with ``lock``
+    miss_lock: Lock = field(default_factory=Lock)
+    cache: OrderedDict[str, _CacheEntry] = field(default_factory=OrderedDict)
+    # Min-heap of (expires_at, key). Entries that were overwritten, deleted or
+    # evicted are left in place and skipped when popped.
+    expiry_heap: List[Tuple[float, str]] = field(default_factory=list)
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
 class LRUCache(ICache):
     """Thread-safe LRU (Least Recently Used) cache with TTL support.
 
@@ -26,71 +53,103 @@ class LRUCache(ICache):
     - Is thread-safe for concurrent access
     - Tracks hit/miss statistics
 
+    Keys are spread over up to ``MAX_SHARDS`` shards, each with its own lock,
+    so operations on different keys rarely contend. ``maxsize`` bounds the
+    total across shards; when it is exceeded the least recently used entry of
+    the inserting shard is evicted, so LRU order is exact within a shard and
+    approximate across the whole cache. Small caches use a single shard and
+    keep exact LRU behavior.
+
     Example:
         cache = LRUCache(maxsize=100)
         cache.set("key", value, ttl=3600)  # Cache for 1 hour
         value = cache.get("key")
     """
 
-    def __init__(self, maxsize: Optional[int] = None, default_ttl: Optional[int] = None):
+    MAX_SHARDS = 16
+    MIN_SHARD_SIZE = 8
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+        time_func: Callable[[], float] = time.monotonic,
+    ):
         """Initialize LRU cache.
 
         Args:
             maxsize: Maximum number of items. If None, uses config value.
             default_ttl: Default TTL in seconds. If None, uses config value.
+            time_func: Clock used for TTL expiry, returning seconds
         """
         config = get_config()
         self._maxsize = maxsize or config.performance.cache_size
         self._default_ttl = default_ttl or config.performance.cache_ttl
-
-        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
-        self._lock = Lock()
-
-        # Statistics
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
-        """Check if cache entry is expired.
-
-        Args:
-            entry: Cache entry with 'expires_at' field
-
-        Returns:
-            True if expired, False otherwise
-        """
-        expires_at = entry.get("expires_at")
-        if expires_at is None:
-            return False
-        return time.time() > expires_at
+        self._now = time_func
+
+        num_shards = max(1, min(self.MAX_SHARDS, self._maxsize // self.MIN_SHARD_SIZE))
+        self._shards = [_Shard() for _ in range(num_shards)]
+
+        # Total entry count across shards. Only touched when entries are added
+        # or removed, never on hits.
+        self._size = 0
+        self._size_lock = Lock()
+
+        # get_stats() refreshes this dict in place and hands out a read-only
+        # view of it, so polling stats allocates nothing
+        self._stats: Dict[str, Any] = {
+            "size": 0,
+            "maxsize": self._maxsize,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "hit_rate": 0.0,
+            "total_requests": 0,
+        }
+        self._stats_view = MappingProxyType(self._stats)
+        self._stats_lock = Lock()
+
+    def _shard_for(self, key: str) -> _Shard:
+        """Return the shard responsible for a key."""
+        return self._shards[hash(key) % len(self._shards)]
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
 
+        Absent keys are detected without taking the shard lock. A ``set`` of the
+        same key racing with this check may therefore not be seen, which is no
+        different from the ``get`` simply running first.
+
         Args:
             key: Cache key
 
         Returns:
             Cached value or None if not found or expired
         """
-        with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return None
+        shard = self._shard_for(key)
+        if key not in shard.cache:
+            self._record_miss(shard)
+            return None
 
-            entry = self._cache[key]
+        with shard.lock:
+            entry = shard.cache.get(key)
+            if entry is None:
+                # Removed between the fast-path check and taking the lock
+                self._record_miss(shard)
+                return None
 
-            # Check expiration
-            if self._is_expired(entry):
-                del self._cache[key]
-                self._misses += 1
+            # Check expiration; entries without a TTL skip the clock read
+            expires_at = entry.expires_at
+            if expires_at is not None and self._now() > expires_at:
+                del shard.cache[key]
+                self._record_miss(shard)
+                self._adjust_size(-1)
                 return None
 
             # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            self._hits += 1
-            return entry["value"]
+            shard.cache.move_to_end(key)
+            shard.hits += 1
+            return entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache.
@@ -100,34 +159,66 @@ class LRUCache(ICache):
             value: Value to cache
             ttl: Optional time-to-live in seconds. If None, uses default.
         """
-        with self._lock:
+        shard = self._shard_for(key)
+        with shard.lock:
             # Calculate expiration
             if ttl is None:
                 ttl = self._default_ttl
 
-            expires_at = None if ttl is None else time.time() + ttl
+            expires_at = None if ttl is None else self._now() + ttl
+            if expires_at is not None:
+                heapq.heappush(shard.expiry_heap, (expires_at, key))
+                if len(shard.expiry_heap) > 2 * self._maxsize:
+                    self._compact_expiry_heap(shard)
 
             # Add/update entry
-            if key in self._cache:
-                # Update existing entry
-                self._cache[key] = {
-                    "value": value,
-                    "expires_at": expires_at,
-                    "created_at": time.time(),
-                }
-                self._cache.move_to_end(key)
-            else:
-                # Add new entry
-                self._cache[key] = {
-                    "value": value,
-                    "expires_at": expires_at,
-                    "created_at": time.time(),
-                }
-
-                # Evict if over capacity
-                if len(self._cache) > self._maxsize:
-                    self._cache.popitem(last=False)  # Remove oldest
-                    self._evictions += 1
+            existed = key in shard.cache
+            shard.cache[key] = _CacheEntry(value, expires_at)
+            if existed:
+                shard.cache.move_to_end(key)
+                return
+
+            with self._size_lock:
+                over_capacity = self._size >= self._maxsize
+                if not over_capacity:
+                    self._size += 1
+
+            if not over_capacity:
+                return
+            if len(shard.cache) > 1:
+                # Evict least recently used
+                shard.cache.popitem(last=False)
+                shard.evictions += 1
+                return
+
+        # The new key is alone in its shard; evict from another shard instead.
+        # Done after releasing this shard's lock so two shard locks are never held.
+        self._evict_from_other_shard(shard)
+
+    @staticmethod
+    def _record_miss(shard: _Shard) -> None:
+        """Count a cache miss on a shard."""
+        with shard.miss_lock:
+            shard.misses += 1
+
+    def _evict_from_other_shard(self, exclude: _Shard) -> None:
+        """Evict the least recently used entry of the fullest other shard."""
+        for shard in sorted(self._shards, key=lambda s: len(s.cache), reverse=True):
+            if shard is exclude:
+                continue
+            with shard.lock:
+                if shard.cache:
+                    shard.cache.popitem(last=False)
+                    shard.evictions += 1
+                    return
+
+        # Nothing else to evict (entries were removed concurrently)
+        self._adjust_size(1)
+
+    def _adjust_size(self, delta: int) -> None:
+        """Update the total entry count."""
+        with self._size_lock:
+            self._size += delta
 
     def delete(self, key: str) -> None:
         """Delete value from cache.
@@ -135,37 +226,52 @@ class LRUCache(ICache):
         Args:
             key: Cache key
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        shard = self._shard_for(key)
+        with shard.lock:
+            if shard.cache.pop(key, None) is not None:
+                self._adjust_size(-1)
 
     def clear(self) -> None:
         """Clear all cached values."""
-        with self._lock:
-            self._cache.clear()
-            self._hits = 0
-            self._misses = 0
-            self._evictions = 0
-
-    def get_stats(self) -> Dict[str, Any]:
+        for shard in self._shards:
+            with shard.lock:
+                self._adjust_size(-len(shard.cache))
+                shard.cache.clear()
+                shard.expiry_heap.clear()
+                shard.hits = 0
+                shard.evictions = 0
+                with shard.miss_lock:
+                    shard.misses = 0
+
+    def get_stats(self) -> Mapping[str, Any]:
         """Get cache statistics.
 
+        The same read-only mapping is returned on every call and is refreshed
+        in place; copy it with ``dict()`` to keep a snapshot.
+
         Returns:
-            Dictionary with cache statistics
+            Read-only mapping with cache statistics
         """
-        with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
-
-            return {
-                "size": len(self._cache),
-                "maxsize": self._maxsize,
-                "hits": self._hits,
-                "misses": self._misses,
-                "evictions": self._evictions,
-                "hit_rate": hit_rate,
-                "total_requests": total_requests,
-            }
+        size = hits = misses = evictions = 0
+        for shard in self._shards:
+            with shard.lock:
+                size += len(shard.cache)
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0.0
+
+        with self._stats_lock:
+            stats = self._stats
+            stats["size"] = size
+            stats["hits"] = hits
+            stats["misses"] = misses
+            stats["evictions"] = evictions
+            stats["hit_rate"] = hit_rate
+            stats["total_requests"] = total_requests
+        return self._stats_view
 
     def cleanup_expired(self) -> int:
         """Remove expired entries from cache.
@@ -173,21 +279,48 @@ class LRUCache(ICache):
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            expired_keys = [key for key, entry in self._cache.items() if self._is_expired(entry)]
-
-            for key in expired_keys:
-                del self._cache[key]
-
-            return len(expired_keys)
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                now = self._now()
+                heap = shard.expiry_heap
+                while heap and heap[0][0] < now:
+                    expires_at, key = heapq.heappop(heap)
+                    entry = shard.cache.get(key)
+                    # Skip stale heap items whose key was re-set with a new expiry
+                    if entry is not None and entry.expires_at == expires_at:
+                        del shard.cache[key]
+                        self._adjust_size(-1)
+                        removed += 1
+
+        return removed
+
+    @staticmethod
+    def _compact_expiry_heap(shard: _Shard) -> None:
+        """Rebuild a shard's expiry heap from live entries, dropping stale items.
+
+        Must be called with the shard lock held.
+        """
+        shard.expiry_heap = [
+            (entry.expires_at, key)
+            for key, entry in shard.cache.items()
+            if entry.expires_at is not None
+        ]
+        heapq.heapify(shard.expiry_heap)
 
 
 class PresentationCache:
     """Specialized cache for PPTX Presentation objects.
 
-    This cache uses file modification time and path as cache key,
+    This cache uses file path, modification time and size as cache key,
     automatically invalidating entries when the file changes.
 
+    ``os.stat`` results are reused for ``stat_ttl`` seconds, so back-to-back
+    lookups of the same file skip the syscall. A change made by another process
+    within that window is only noticed once it expires; ``invalidate()`` drops
+    the remembered stat immediately. Expired stat results are pruned on every
+    lookup, so only files stat'ed within the last ``stat_ttl`` seconds are kept.
+
     Example:
         cache = PresentationCache()
         presentation = cache.get_presentation(path)
@@ -196,18 +329,60 @@ class PresentationCache:
             cache.cache_presentation(path, presentation)
     """
 
-    def __init__(self, cache: Optional[ICache] = None):
+    def __init__(
+        self,
+        cache: Optional[ICache] = None,
+        stat_ttl: float = 1.0,
+        time_func: Callable[[], float] = time.monotonic,
+    ):
         """Initialize presentation cache.
 
         Args:
             cache: Optional cache implementation. If None, creates LRUCache.
+            stat_ttl: Seconds to reuse a file's stat result. 0 disables reuse.
+            time_func: Clock used for stat reuse, returning seconds
         """
         self._cache = cache or LRUCache()
+        self._stat_ttl = stat_ttl
+        self._now = time_func
+        # Ordered oldest stat first, so expired entries are pruned from the front
+        self._stat_cache: OrderedDict[str, Tuple[float, os.stat_result]] = OrderedDict()
+
+    def _stat(self, pptx_path: Path) -> os.stat_result:
+        """Stat a file, reusing a recent result for the same path.
+
+        Args:
+            pptx_path: Path to PPTX file
+
+        Returns:
+            Stat result for the file
+        """
+        path_key = str(pptx_path)
+        now = self._now()
+        stat_cache = self._stat_cache
+        while stat_cache:
+            oldest_key = next(iter(stat_cache))
+            if now - stat_cache[oldest_key][0] < self._stat_ttl:
+                break
+            del stat_cache[oldest_key]
+
+        cached = stat_cache.get(path_key)
+        if cached is not None:
+            return cached[1]
+
+        try:
+            st = os.stat(path_key)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PPTX file not found: {pptx_path}") from None
+
+        if self._stat_ttl > 0:
+            stat_cache[path_key] = (now, st)
+        return st
 
     def _get_cache_key(self, pptx_path: Path) -> str:
         """Generate cache key for PPTX file.
 
-        Includes file path and modification time to auto-invalidate on changes.
+        Includes file path, modification time and size to auto-invalidate on changes.
 
         Args:
             pptx_path: Path to PPTX file
@@ -215,14 +390,12 @@ class PresentationCache:
         Returns:
             Cache key string
         """
-        if not pptx_path.exists():
-            raise FileNotFoundError(f"PPTX file not found: {pptx_path}")
+        return self._format_key(pptx_path, self._stat(pptx_path))
 
-        mtime = pptx_path.stat().st_mtime
-        key_str = f"{pptx_path}:{mtime}"
-
-        # Use hash for shorter key (avoid MD5 to satisfy security tooling)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+    @staticmethod
+    def _format_key(pptx_path: Path, st: os.stat_result) -> str:
+        """Build the cache key for a file from its stat result."""
+        return f"{pptx_path}:{st.st_mtime_ns}:{st.st_size}"
 
     def get_presentation(self, pptx_path: Path) -> Optional[Presentation]:
         """Get cached presentation.
@@ -262,6 +435,12 @@ class PresentationCache:
         Args:
             pptx_path: Path to PPTX file
         """
+        # Drop the entry keyed by the remembered stat as well as the current one,
+        # in case the file changed since it was last stat'ed
+        cached = self._stat_cache.pop(str(pptx_path), None)
+        if cached is not None:
+            self._cache.delete(self._format_key(pptx_path, cached[1]))
+
         try:
             cache_key = self._get_cache_key(pptx_path)
             self._cache.delete(cache_key)
@@ -272,11 +451,12 @@ class PresentationCache:
     def clear(self) -> None:
         """Clear all cached presentations."""
         self._cache.clear()
+        self._stat_cache.clear()
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> Mapping[str, Any]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics
+            Read-only mapping with cache statistics
         """
         return self._cache.get_stats()
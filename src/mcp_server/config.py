@@ -5,10 +5,10 @@ validation, and defaults for different deployment environments.
 """
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Set
+from typing import Any, Callable, FrozenSet, Optional
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
@@ -22,7 +22,13 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
-@dataclass
+# Environment members by value, for parsing MCP_ENV without enum lookup
+_ENV_MAP = {env.value: env for env in Environment}
+
+_LOG_LEVEL_SET = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+@dataclass(frozen=True, slots=True)
 class SecurityConfig:
     """Security-related configuration."""
 
@@ -30,7 +36,7 @@ class SecurityConfig:
     max_file_size: int = 1024 * 1024 * 1024  # 1GB default
 
     # Allowed file extensions (beyond .pptx)
-    allowed_extensions: Set[str] = field(default_factory=lambda: {".pptx", ".pptm"})
+    allowed_extensions: FrozenSet[str] = frozenset({".pptx", ".pptm"})
 
     # Workspace boundaries (restrict file access to these directories)
     workspace_dirs: list[Path] = field(default_factory=list)
@@ -44,7 +50,7 @@ class SecurityConfig:
     max_path_length: int = 4096
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PerformanceConfig:
     """Performance-related configuration."""
 
@@ -62,7 +68,7 @@ class PerformanceConfig:
     max_requests_per_minute: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -84,9 +90,14 @@ class LoggingConfig:
     log_file: Optional[Path] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Main configuration class."""
+    """Main configuration class.
+
+    Configurations are immutable and checked on construction. Use ``replace()``
+    (or ``dataclasses.replace`` for the nested sections) to derive a modified
+    copy.
+    """
 
     # Environment
     environment: Environment = Environment.DEVELOPMENT
@@ -129,83 +140,68 @@ class Config:
         - MCP_RESOURCE_SEARCH_PATHS: Comma-separated list of resource search paths
         - AZURE_AI_PROJECT_ENDPOINT: Azure endpoint
         - MODEL_DEPLOYMENT_NAME: Azure model deployment name
+
+        See ``_ENV_SPEC`` for the full list and how each value is parsed.
         """
         # Load .env file if it exists
         load_dotenv()
 
-        config = cls()
-
-        # Environment
-        env_str = os.getenv("MCP_ENV", "development").lower()
-        try:
-            config.environment = Environment(env_str)
-        except ValueError:
-            config.environment = Environment.DEVELOPMENT
-
-        # Security settings
-        if max_size := os.getenv("MCP_MAX_FILE_SIZE"):
-            try:
-                config.security.max_file_size = int(max_size)
-            except ValueError:
-                # Invalid integer format, keep default
-                pass
-
-        if workspace_dirs := os.getenv("MCP_WORKSPACE_DIRS"):
-            config.security.workspace_dirs = [
-                Path(d.strip()) for d in workspace_dirs.split(",") if d.strip()
-            ]
-
-        if enforce_boundary := os.getenv("MCP_ENFORCE_WORKSPACE_BOUNDARY"):
-            config.security.enforce_workspace_boundary = enforce_boundary.lower() == "true"
-
-        # Performance settings
-        if enable_cache := os.getenv("MCP_ENABLE_CACHE"):
-            config.performance.enable_cache = enable_cache.lower() == "true"
-
-        if cache_size := os.getenv("MCP_CACHE_SIZE"):
-            try:
-                config.performance.cache_size = int(cache_size)
-            except ValueError:
-                # Invalid integer format, keep default
-                pass
-
-        # Logging settings
-        config.logging.level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
-
-        if log_file := os.getenv("MCP_LOG_FILE"):
-            config.logging.log_file = Path(log_file)
-
-        if enable_structured := os.getenv("MCP_ENABLE_STRUCTURED_LOGGING"):
-            config.logging.enable_structured_logging = enable_structured.lower() == "true"
-
-        # Azure settings
-        config.azure_endpoint = os.getenv("AZURE_AI_PROJECT_ENDPOINT")
-        config.azure_deployment_name = os.getenv("MODEL_DEPLOYMENT_NAME")
-
-        # Azure audio transcription settings
-        config.audio_endpoint = os.getenv("AUDIO_ENDPOINT") or os.getenv("SPEECH_ENDPOINT") or os.getenv("ENDPOINT") or None
-        config.audio_deployment = os.getenv("AUDIO_DEPLOYMENT") or os.getenv("SPEECH_DEPLOYMENT") or None
-        config.audio_key = os.getenv("AUDIO_KEY") or os.getenv("SPEECH_KEY") or None
-        config.audio_region = os.getenv("AUDIO_REGION") or os.getenv("SPEECH_REGION") or None
-        config.audio_api_version = os.getenv("AUDIO_API_VERSION", config.audio_api_version)
-
-        # Feature flags
-        if enable_metrics := os.getenv("MCP_ENABLE_METRICS"):
-            config.enable_metrics = enable_metrics.lower() == "true"
-
-        if enable_audit := os.getenv("MCP_ENABLE_AUDIT_LOGGING"):
-            config.enable_audit_logging = enable_audit.lower() == "true"
-
-        # Resource search paths
-        if search_paths := os.getenv("MCP_RESOURCE_SEARCH_PATHS"):
-            config.resource_search_paths = [
-                Path(p.strip()) for p in search_paths.split(",") if p.strip()
-            ]
-
-        return config
+        defaults = cls()
+        top_level: dict[str, Any] = {}
+        sections: dict[str, dict[str, Any]] = {}
+        environ = os.environ
+        for env_keys, attr_path, coerce in _ENV_SPEC:
+            # First non-empty variable wins; unset or empty keeps the default
+            value = next((v for k in env_keys if (v := environ.get(k))), None)
+            if value is None:
+                continue
+
+            if len(attr_path) == 1:
+                (attr,) = attr_path
+                top_level[attr] = coerce(value, getattr(defaults, attr))
+            else:
+                section, attr = attr_path
+                default = getattr(getattr(defaults, section), attr)
+                sections.setdefault(section, {})[attr] = coerce(value, default)
+
+        for section, changes in sections.items():
+            top_level[section] = replace(getattr(defaults, section), **changes)
+
+        return defaults.replace(**top_level)
+
+    def replace(self, **changes: Any) -> "Config":
+        """Return a copy of this configuration with the given fields replaced.
+
+        Args:
+            **changes: Field values to override
+
+        Returns:
+            Config: New, validated configuration
+        """
+        return replace(self, **changes)
+
+    def __post_init__(self) -> None:
+        self._validate_values()
 
     def validate(self) -> None:
-        """Validate configuration values.
+        """Validate configuration values and the workspace directories they name.
+
+        Value checks already run on construction; this additionally checks the
+        filesystem.
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        self._validate_values()
+
+        # Validate workspace directories exist (if enforcement is enabled)
+        if self.security.enforce_workspace_boundary and self.security.workspace_dirs:
+            for workspace_dir in self.security.workspace_dirs:
+                if not workspace_dir.exists():
+                    raise ValueError(f"Workspace directory does not exist: {workspace_dir}")
+
+    def _validate_values(self) -> None:
+        """Validate configuration values without touching the filesystem.
 
         Raises:
             ValueError: If configuration is invalid
@@ -227,10 +223,9 @@ class Config:
             )
 
         # Validate logging settings
-        valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.logging.level not in valid_log_levels:
+        if self.logging.level not in _LOG_LEVEL_SET:
             raise ValueError(
-                f"Invalid log level: {self.logging.level}. Must be one of {valid_log_levels}"
+                f"Invalid log level: {self.logging.level}. Must be one of {sorted(_LOG_LEVEL_SET)}"
             )
 
         # Validate audio transcription settings when provided
@@ -249,11 +244,82 @@ class Config:
             if not self.audio_api_version:
                 raise ValueError("audio_api_version must be provided when audio transcription is set.")
 
-        # Validate workspace directories exist (if enforcement is enabled)
-        if self.security.enforce_workspace_boundary and self.security.workspace_dirs:
-            for workspace_dir in self.security.workspace_dirs:
-                if not workspace_dir.exists():
-                    raise ValueError(f"Workspace directory does not exist: {workspace_dir}")
+
+def _to_int(value: str, default: Any) -> Any:
+    """Parse an integer, keeping the default on invalid input."""
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _to_bool(value: str, default: Any) -> bool:
+    """Parse a boolean flag; only "true" (any case) is truthy."""
+    return value.lower() == "true"
+
+
+def _to_upper(value: str, default: Any) -> str:
+    """Normalize a value to upper case."""
+    return value.upper()
+
+
+def _to_str(value: str, default: Any) -> str:
+    """Use the value as-is."""
+    return value
+
+
+def _to_path(value: str, default: Any) -> Path:
+    """Parse a single path."""
+    return Path(value)
+
+
+def _to_path_list(value: str, default: Any) -> list[Path]:
+    """Parse a comma-separated list of paths, skipping blank items."""
+    return [Path(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def _to_environment(value: str, default: Any) -> Environment:
+    """Parse a deployment environment, falling back to development."""
+    return _ENV_MAP.get(value.lower(), Environment.DEVELOPMENT)
+
+
+# (environment variables in priority order, attribute path on Config, parser)
+_ENV_SPEC: tuple[tuple[tuple[str, ...], tuple[str, ...], Callable[[str, Any], Any]], ...] = (
+    (("MCP_ENV",), ("environment",), _to_environment),
+    # Security settings
+    (("MCP_MAX_FILE_SIZE",), ("security", "max_file_size"), _to_int),
+    (("MCP_WORKSPACE_DIRS",), ("security", "workspace_dirs"), _to_path_list),
+    (
+        ("MCP_ENFORCE_WORKSPACE_BOUNDARY",),
+        ("security", "enforce_workspace_boundary"),
+        _to_bool,
+    ),
+    # Performance settings
+    (("MCP_ENABLE_CACHE",), ("performance", "enable_cache"), _to_bool),
+    (("MCP_CACHE_SIZE",), ("performance", "cache_size"), _to_int),
+    # Logging settings
+    (("MCP_LOG_LEVEL",), ("logging", "level"), _to_upper),
+    (("MCP_LOG_FILE",), ("logging", "log_file"), _to_path),
+    (
+        ("MCP_ENABLE_STRUCTURED_LOGGING",),
+        ("logging", "enable_structured_logging"),
+        _to_bool,
+    ),
+    # Azure settings
+    (("AZURE_AI_PROJECT_ENDPOINT",), ("azure_endpoint",), _to_str),
+    (("MODEL_DEPLOYMENT_NAME",), ("azure_deployment_name",), _to_str),
+    # Azure audio transcription settings
+    (("AUDIO_ENDPOINT", "SPEECH_ENDPOINT", "ENDPOINT"), ("audio_endpoint",), _to_str),
+    (("AUDIO_DEPLOYMENT", "SPEECH_DEPLOYMENT"), ("audio_deployment",), _to_str),
+    (("AUDIO_KEY", "SPEECH_KEY"), ("audio_key",), _to_str),
+    (("AUDIO_REGION", "SPEECH_REGION"), ("audio_region",), _to_str),
+    (("AUDIO_API_VERSION",), ("audio_api_version",), _to_str),
+    # Feature flags
+    (("MCP_ENABLE_METRICS",), ("enable_metrics",), _to_bool),
+    (("MCP_ENABLE_AUDIT_LOGGING",), ("enable_audit_logging",), _to_bool),
+    # Resource search paths
+    (("MCP_RESOURCE_SEARCH_PATHS",), ("resource_search_paths",), _to_path_list),
+)
 
 
 # Global configuration instance
@@ -1,24 +1,129 @@
 """Image extraction utilities for PPTX files."""
 
-import base64
+import binascii
 import io
+import struct
 import zipfile
+from contextlib import contextmanager
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from PIL import Image
 
 from ..utils.validators import validate_pptx_path, validate_slide_number
 
+# Bytes read from each media entry when probing its header. Enough for PNG,
+# GIF and BMP, and for JPEG files whose EXIF block does not push the frame
+# header further out; anything else falls back to a full read.
+_PROBE_BYTES = 64 * 1024
+
+# Raw bytes encoded per base64 step; a multiple of 3 so no chunk is padded
+_BASE64_CHUNK = 57 * 1024
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_GIF_SIGNATURES = (b"GIF87a", b"GIF89a")
+# Start-of-frame markers carrying the image dimensions (excludes DHT, JPG, DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+_shape_geometry = attrgetter("shape_id", "left", "top", "width", "height")
+
+
+@contextmanager
+def open_pptx_archive(pptx_path: str | Path) -> Iterator[zipfile.ZipFile]:
+    """Open a PPTX once for a batch of image extractions.
+
+    Pass the yielded archive as ``zip_file`` to ``extract_images_from_pptx`` and
+    ``extract_image_as_base64`` so the central directory is parsed once for the
+    whole batch. The handle is closed when the block exits, so nothing keeps the
+    file open (or blocks in-place rewrites) after the batch.
+    """
+    with zipfile.ZipFile(validate_pptx_path(pptx_path), "r") as zip_file:
+        yield zip_file
+
+
+@contextmanager
+def _open_zip(
+    pptx_path: Path, zip_file: Optional[zipfile.ZipFile] = None
+) -> Iterator[zipfile.ZipFile]:
+    """Yield the caller's open archive, or open the PPTX just for this call."""
+    if zip_file is not None:
+        yield zip_file
+        return
+    with zipfile.ZipFile(pptx_path, "r") as opened:
+        yield opened
+
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Find the width and height in a JPEG's start-of-frame segment."""
+    i = 2
+    end = len(data)
+    while i + 9 <= end:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Standalone markers have no length field
+            i += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", data, i + 5)
+            return width, height
+        (length,) = struct.unpack_from(">H", data, i + 2)
+        i += 2 + length
+    return None
+
+
+def _probe_header(data: bytes) -> Optional[Tuple[int, int, str]]:
+    """Read width, height and format from the header of common image formats.
+
+    Returns:
+        (width, height, format) or None if the format is not recognized or the
+        header is incomplete
+    """
+    if data[:8] == _PNG_SIGNATURE and len(data) >= 24:
+        width, height = struct.unpack_from(">II", data, 16)
+        return width, height, "PNG"
+    if data[:2] == b"\xff\xd8":
+        size = _jpeg_size(data)
+        return (size[0], size[1], "JPEG") if size else None
+    if data[:6] in _GIF_SIGNATURES and len(data) >= 10:
+        width, height = struct.unpack_from("<HH", data, 6)
+        return width, height, "GIF"
+    if data[:2] == b"BM" and len(data) >= 26:
+        width, height = struct.unpack_from("<ii", data, 18)
+        return width, abs(height), "BMP"
+    return None
+
+
+def _probe_image(data: bytes) -> Tuple[int, int, str]:
+    """Get width, height and format of an image, parsing with PIL only if needed."""
+    info = _probe_header(data)
+    if info is not None:
+        return info
+    img = Image.open(io.BytesIO(data))
+    width, height = img.size
+    return width, height, img.format or "UNKNOWN"
+
 
 def extract_images_from_pptx(
-    pptx_path: str | Path, slide_number: Optional[int] = None
+    pptx_path: str | Path,
+    slide_number: Optional[int] = None,
+    zip_file: Optional[zipfile.ZipFile] = None,
 ) -> List[Dict[str, Any]]:
-    """Extract images from PPTX file."""
+    """Extract images from PPTX file.
+
+    ``zip_file`` may be an archive from ``open_pptx_archive`` for the same path,
+    to share one open handle across several extractions.
+    """
     pptx_path = validate_pptx_path(pptx_path)
 
     images = []
-    with zipfile.ZipFile(pptx_path, "r") as zip_file:
+    with _open_zip(pptx_path, zip_file) as zip_file:
         # List all image files in the PPTX
         image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".wmf", ".emf"}
 
@@ -28,17 +133,22 @@ def extract_images_from_pptx(
                 # Check if it's in media folder (embedded images)
                 if "ppt/media/" in file_info.filename:
                     try:
-                        image_data = zip_file.read(file_info.filename)
-                        # Try to get image info
-                        img = Image.open(io.BytesIO(image_data))
-                        width, height = img.size
-                        format_name = img.format or "UNKNOWN"
+                        # Stream only the header; the full blob is read only
+                        # for formats the header probe does not understand
+                        with zip_file.open(file_info) as image_file:
+                            header = image_file.read(_PROBE_BYTES)
+                        info = _probe_header(header)
+                        if info is None:
+                            if len(header) == _PROBE_BYTES:
+                                header = zip_file.read(file_info.filename)
+                            info = _probe_image(header)
+                        width, height, format_name = info
 
                         images.append(
                             {
                                 "path": file_info.filename,
                                 "filename": file_path.name,
-                                "size": len(image_data),
+                                "size": file_info.file_size,
                                 "width": width,
                                 "height": height,
                                 "format": format_name,
@@ -51,17 +161,36 @@ def extract_images_from_pptx(
     return images
 
 
-def extract_image_as_base64(pptx_path: str | Path, image_path_in_zip: str) -> Optional[str]:
-    """Extract a specific image from PPTX and return as base64."""
+def extract_image_as_base64(
+    pptx_path: str | Path,
+    image_path_in_zip: str,
+    zip_file: Optional[zipfile.ZipFile] = None,
+) -> Optional[str]:
+    """Extract a specific image from PPTX and return as base64.
+
+    ``zip_file`` may be an archive from ``open_pptx_archive`` for the same path.
+    """
     pptx_path = validate_pptx_path(pptx_path)
 
-    with zipfile.ZipFile(pptx_path, "r") as zip_file:
+    with _open_zip(pptx_path, zip_file) as zip_file:
         try:
-            image_data = zip_file.read(image_path_in_zip)
-            return base64.b64encode(image_data).decode("utf-8")
+            info = zip_file.getinfo(image_path_in_zip)
         except KeyError:
             return None
 
+        # Encode chunk by chunk into a preallocated buffer so the raw image is
+        # never held in memory alongside its encoding
+        encoded = bytearray(4 * ((info.file_size + 2) // 3))
+        pos = 0
+        with zip_file.open(info) as image_file:
+            while chunk := image_file.read(_BASE64_CHUNK):
+                piece = binascii.b2a_base64(chunk, newline=False)
+                encoded[pos : pos + len(piece)] = piece
+                pos += len(piece)
+        del encoded[pos:]
+
+    return encoded.decode("ascii")
+
 
 async def extract_slide_images(pptx_path: str | Path, slide_number: int) -> List[Dict[str, Any]]:
     """Extract images associated with a specific slide."""
@@ -77,28 +206,28 @@ async def extract_slide_images(pptx_path: str | Path, slide_number: int) -> List
 
     # Extract images from shapes
     for shape in slide.shapes:
-        if hasattr(shape, "image"):
-            try:
-                image = shape.image
-                # Get image blob
-                image_blob = image.blob
-                img = Image.open(io.BytesIO(image_blob))
-                width, height = img.size
-
-                images.append(
-                    {
-                        "shape_id": shape.shape_id,
-                        "name": shape.name if hasattr(shape, "name") else "",
-                        "left": shape.left,
-                        "top": shape.top,
-                        "width": shape.width,
-                        "height": shape.height,
-                        "image_width": width,
-                        "image_height": height,
-                        "format": img.format or "UNKNOWN",
-                    }
-                )
-            except Exception:
-                continue
+        try:
+            # Only picture shapes (including picture placeholders) have an
+            # image; reading it once replaces a hasattr() probe that built the
+            # Image object twice
+            image_blob = shape.image.blob
+            width, height, format_name = _probe_image(image_blob)
+            shape_id, left, top, shape_width, shape_height = _shape_geometry(shape)
+
+            images.append(
+                {
+                    "shape_id": shape_id,
+                    "name": getattr(shape, "name", ""),
+                    "left": left,
+                    "top": top,
+                    "width": shape_width,
+                    "height": shape_height,
+                    "image_width": width,
+                    "image_height": height,
+                    "format": format_name,
+                }
+            )
+        except Exception:
+            continue
 
     return images
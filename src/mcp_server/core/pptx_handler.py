@@ -1,5 +1,6 @@
 """Core PPTX file operations handler."""
 
+import asyncio
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -48,6 +49,9 @@ class PPTXHandler:
         self._cache = cache if self._enable_cache else None
         self._is_modified = False
 
+        # Bit i set means slide i + 1 is hidden; built lazily on first use
+        self._hidden_mask: Optional[int] = None
+
     async def get_presentation(self) -> Presentation:
         """Load presentation with optional caching."""
         if self._presentation is None:
@@ -92,6 +96,7 @@ class PPTXHandler:
         """
         self._presentation = None
         self._is_modified = False
+        self._hidden_mask = None
 
         # Invalidate cache
         if self._cache and self._enable_cache:
@@ -102,6 +107,42 @@ class PPTXHandler:
         pres = await self.get_presentation()
         return len(pres.slides)
 
+    @staticmethod
+    def _has_show_off(element: Any) -> bool:
+        """Check whether an element carries show="0"."""
+        show_attr = element.get("show")
+        return show_attr is not None and str(show_attr).strip() == "0"
+
+    async def _get_hidden_mask(self) -> int:
+        """Get the hidden-slide bitmask, building it in one pass on first use.
+
+        Returns:
+            Integer whose bit i is set when slide i + 1 is hidden
+        """
+        if self._hidden_mask is None:
+            pres = await self.get_presentation()
+
+            # Check for 'show' attribute in two locations:
+            # 1. On the <p:sld> element (the slide part)
+            # 2. On the <p:sldId> element in presentation.xml (standard PowerPoint)
+            try:
+                # prs.slides._sldIdLst is the list of <p:sldId> elements
+                sld_id_lst = list(pres.slides._sldIdLst)
+            except (AttributeError, TypeError):
+                # Fallback if internals change or are inaccessible
+                sld_id_lst = []
+
+            mask = 0
+            for idx, slide in enumerate(pres.slides):
+                sld_id = sld_id_lst[idx] if idx < len(sld_id_lst) else None
+                if self._has_show_off(slide.element) or (
+                    sld_id is not None and self._has_show_off(sld_id)
+                ):
+                    mask |= 1 << idx
+
+            self._hidden_mask = mask
+        return self._hidden_mask
+
     async def is_slide_hidden(self, slide_number: int) -> bool:
         """Check if a slide is hidden.
 
@@ -113,34 +154,8 @@ class PPTXHandler:
         """
         slide_count = await self.get_slide_count()
         validate_slide_number(slide_number, slide_count)
-        pres = await self.get_presentation()
-        slide = pres.slides[slide_number - 1]
-
-        # Check for 'show' attribute in two locations:
-        # 1. On the <p:sld> element (the slide part)
-        # 2. On the <p:sldId> element in presentation.xml (standard PowerPoint)
-
-        # Check location 1: <p:sld> element
-        show_attr = slide.element.get("show")
-        if show_attr is not None:
-            if str(show_attr).strip() == "0":
-                return True
-
-        # Check location 2: <p:sldId> element
-        try:
-            # prs.slides._sldIdLst is the list of <p:sldId> elements
-            sld_id_lst = pres.slides._sldIdLst
-            if slide_number - 1 < len(sld_id_lst):
-                sld_id_element = sld_id_lst[slide_number - 1]
-                show_attr = sld_id_element.get("show")
-                if show_attr is not None:
-                    if str(show_attr).strip() == "0":
-                        return True
-        except (AttributeError, IndexError, ValueError):
-            # Fallback if internals change or are inaccessible
-            pass
-
-        return False
+        mask = await self._get_hidden_mask()
+        return bool(mask >> (slide_number - 1) & 1)
 
     async def set_slide_hidden(self, slide_number: int, hidden: bool):
         """Set slide visibility.
@@ -177,16 +192,18 @@ class PPTXHandler:
             except (AttributeError, IndexError):
                 pass
 
+        # Keep the hidden-slide bitmask in sync with the XML
+        if self._hidden_mask is not None:
+            bit = 1 << (slide_number - 1)
+            self._hidden_mask = self._hidden_mask | bit if hidden else self._hidden_mask & ~bit
+
         # Mark as modified
         self._is_modified = True
 
     async def get_presentation_info(self) -> Dict[str, Any]:
         """Get presentation metadata."""
         slide_count = await self.get_slide_count()
-        hidden_count = 0
-        for i in range(1, slide_count + 1):
-            if await self.is_slide_hidden(i):
-                hidden_count += 1
+        hidden_count = (await self._get_hidden_mask()).bit_count()
         visible_count = slide_count - hidden_count
 
         pres = await self.get_presentation()
@@ -245,7 +262,43 @@ class PPTXHandler:
         validate_slide_number(slide_number, slide_count)
         pres = await self.get_presentation()
         slide = pres.slides[slide_number - 1]
+        hidden = await self.is_slide_hidden(slide_number)
+        return self._extract_slide_content(slide, slide_number, hidden)
+
+    async def get_slides_content(self, slide_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Get comprehensive content from several slides.
+
+        Each slide is extracted in a worker thread so independent slide parts
+        are processed concurrently instead of one after another.
+
+        Args:
+            slide_numbers: Slide numbers (1-indexed) to extract
+
+        Returns:
+            List of slide content dictionaries, in the order requested
+        """
+        slide_count = await self.get_slide_count()
+        for slide_number in slide_numbers:
+            validate_slide_number(slide_number, slide_count)
+        pres = await self.get_presentation()
+        hidden_mask = await self._get_hidden_mask()
+
+        return list(
+            await asyncio.gather(
+                *(
+                    run_in_thread(
+                        self._extract_slide_content,
+                        pres.slides[slide_number - 1],
+                        slide_number,
+                        bool(hidden_mask >> (slide_number - 1) & 1),
+                    )
+                    for slide_number in slide_numbers
+                )
+            )
+        )
 
+    def _extract_slide_content(self, slide, slide_number: int, hidden: bool) -> Dict[str, Any]:
+        """Build the content dictionary for a single slide."""
         # Extract title
         title = ""
         if slide.shapes.title:
@@ -283,7 +336,7 @@ class PPTXHandler:
             "title": title,
             "text": text,
             "shapes": shapes_info,
-            "hidden": await self.is_slide_hidden(slide_number),
+            "hidden": hidden,
         }
 
     async def get_slide_images(self, slide_number: int) -> List[Dict[str, Any]]:
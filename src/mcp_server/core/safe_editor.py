@@ -19,6 +19,12 @@ _XML_NS = {
     "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
 }
 
+# Queries run for every notes part; compiled once instead of per call
+_XP_BODY_SHAPE = etree.XPath("//p:sp[p:nvSpPr/p:nvPr/p:ph[@type='body']]", namespaces=_XML_NS)
+_XP_TEXT_SHAPE = etree.XPath("//p:sp[.//a:txBody]", namespaces=_XML_NS)
+_XP_P_TX_BODY = etree.XPath(".//p:txBody", namespaces=_XML_NS)
+_XP_A_TX_BODY = etree.XPath(".//a:txBody", namespaces=_XML_NS)
+
 
 def _notes_part_for_slide(zip_in: zipfile.ZipFile, slide_no: int) -> str | None:
     """Find the notes slide part for a given slide number."""
@@ -51,19 +57,19 @@ def _set_notes_text(notes_xml: bytes, notes_text: str) -> bytes:
     root = etree.fromstring(notes_xml, parser)
 
     # Find the 'body' placeholder shape which holds the notes text.
-    sp_list = root.xpath("//p:sp[p:nvSpPr/p:nvPr/p:ph[@type='body']]", namespaces=_XML_NS)
+    sp_list = _XP_BODY_SHAPE(root)
     sp = sp_list[0] if sp_list else None
     if sp is None:
         # Fallback: first shape with a text body.
-        sp_list = root.xpath("//p:sp[.//a:txBody]", namespaces=_XML_NS)
+        sp_list = _XP_TEXT_SHAPE(root)
         sp = sp_list[0] if sp_list else None
     if sp is None:
         return notes_xml
 
     # Try both namespaces - txBody can be in 'a' or 'p' namespace depending on structure
-    tx_list = sp.xpath(".//p:txBody", namespaces=_XML_NS)
+    tx_list = _XP_P_TX_BODY(sp)
     if not tx_list:
-        tx_list = sp.xpath(".//a:txBody", namespaces=_XML_NS)
+        tx_list = _XP_A_TX_BODY(sp)
     tx_body = tx_list[0] if tx_list else None
     if tx_body is None:
         return notes_xml
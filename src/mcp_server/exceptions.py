@@ -4,7 +4,7 @@ This module defines a structured exception hierarchy for better error handling,
 categorization, and recovery strategies throughout the MCP server.
 """
 
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 
 class PPTXError(Exception):
@@ -14,6 +14,15 @@ class PPTXError(Exception):
     This allows for catching all server-specific errors with a single except clause.
     """
 
+    __slots__ = ("message", "details", "cause", "_cause_str")
+
+    # Class name reported by to_dict(); set for every subclass by __init_subclass__
+    _error_type: ClassVar[str] = "PPTXError"
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._error_type = cls.__name__
+
     def __init__(
         self,
         message: str,
@@ -31,6 +40,7 @@ class PPTXError(Exception):
         self.message = message
         self.details = details or {}
         self.cause = cause
+        self._cause_str = str(cause) if cause is not None else None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert exception to dictionary for JSON serialization.
@@ -39,12 +49,12 @@ class PPTXError(Exception):
             Dictionary representation of the error
         """
         result = {
-            "error_type": self.__class__.__name__,
+            "error_type": self._error_type,
             "message": self.message,
             "details": self.details,
         }
-        if self.cause:
-            result["cause"] = str(self.cause)
+        if self._cause_str is not None:
+            result["cause"] = self._cause_str
         return result
 
 
@@ -59,10 +69,14 @@ class ValidationError(PPTXError):
     This includes invalid parameters, malformed data, or constraint violations.
     """
 
+    __slots__ = ()
+
 
 class InvalidSlideNumberError(ValidationError):
     """Raised when a slide number is out of valid range."""
 
+    __slots__ = ()
+
     def __init__(self, slide_number: int, max_slides: int, **kwargs):
         super().__init__(
             f"Invalid slide number: {slide_number}. Must be between 1 and {max_slides}",
@@ -74,6 +88,8 @@ class InvalidSlideNumberError(ValidationError):
 class InvalidPathError(ValidationError):
     """Raised when a file path is invalid or insecure."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, reason: str = "Invalid path", **kwargs):
         super().__init__(f"{reason}: {path}", details={"path": path, "reason": reason}, **kwargs)
 
@@ -81,6 +97,8 @@ class InvalidPathError(ValidationError):
 class InvalidFormatError(ValidationError):
     """Raised when data format is invalid."""
 
+    __slots__ = ()
+
     def __init__(self, format_name: str, expected: str, got: str, **kwargs):
         super().__init__(
             f"Invalid {format_name} format. Expected: {expected}, got: {got}",
@@ -92,6 +110,8 @@ class InvalidFormatError(ValidationError):
 class InputTooLargeError(ValidationError):
     """Raised when input exceeds size limits."""
 
+    __slots__ = ()
+
     def __init__(self, input_type: str, size: int, max_size: int, **kwargs):
         super().__init__(
             f"{input_type} size ({size} bytes) exceeds maximum allowed ({max_size} bytes)",
@@ -108,10 +128,14 @@ class InputTooLargeError(ValidationError):
 class FileOperationError(PPTXError):
     """Base class for file operation errors."""
 
+    __slots__ = ()
+
 
 class PPTXFileNotFoundError(FileOperationError):
     """Raised when a required file is not found."""
 
+    __slots__ = ()
+
     def __init__(self, file_path: str, **kwargs):
         super().__init__(f"File not found: {file_path}", details={"file_path": file_path}, **kwargs)
 
@@ -119,6 +143,8 @@ class PPTXFileNotFoundError(FileOperationError):
 class FileAccessError(FileOperationError):
     """Raised when file access is denied or restricted."""
 
+    __slots__ = ()
+
     def __init__(self, file_path: str, reason: str = "Access denied", **kwargs):
         super().__init__(
             f"Cannot access file: {file_path}. Reason: {reason}",
@@ -130,6 +156,8 @@ class FileAccessError(FileOperationError):
 class FileCorruptedError(FileOperationError):
     """Raised when a file is corrupted or invalid."""
 
+    __slots__ = ()
+
     def __init__(self, file_path: str, reason: str = "File corrupted", **kwargs):
         super().__init__(
             f"File is corrupted or invalid: {file_path}. Reason: {reason}",
@@ -141,6 +169,8 @@ class FileCorruptedError(FileOperationError):
 class FileTooLargeError(FileOperationError):
     """Raised when a file exceeds size limits."""
 
+    __slots__ = ()
+
     def __init__(self, file_path: str, size: int, max_size: int, **kwargs):
         super().__init__(
             f"File too large: {file_path} ({size} bytes). Maximum allowed: {max_size} bytes",
@@ -157,10 +187,14 @@ class FileTooLargeError(FileOperationError):
 class PresentationError(PPTXError):
     """Base class for presentation-related errors."""
 
+    __slots__ = ()
+
 
 class SlideNotFoundError(PresentationError):
     """Raised when a requested slide is not found."""
 
+    __slots__ = ()
+
     def __init__(self, slide_number: int, **kwargs):
         super().__init__(
             f"Slide not found: {slide_number}", details={"slide_number": slide_number}, **kwargs
@@ -170,6 +204,8 @@ class SlideNotFoundError(PresentationError):
 class LayoutNotFoundError(PresentationError):
     """Raised when a requested slide layout is not found."""
 
+    __slots__ = ()
+
     def __init__(self, layout_name: str, **kwargs):
         super().__init__(
             f"Layout not found: {layout_name}", details={"layout_name": layout_name}, **kwargs
@@ -179,6 +215,8 @@ class LayoutNotFoundError(PresentationError):
 class ShapeNotFoundError(PresentationError):
     """Raised when a requested shape is not found."""
 
+    __slots__ = ()
+
     def __init__(self, shape_id: Any, slide_number: int, **kwargs):
         super().__init__(
             f"Shape not found: {shape_id} on slide {slide_number}",
@@ -190,6 +228,8 @@ class ShapeNotFoundError(PresentationError):
 class NotesNotFoundError(PresentationError):
     """Raised when speaker notes are not found."""
 
+    __slots__ = ()
+
     def __init__(self, slide_number: int, **kwargs):
         super().__init__(
             f"Notes not found for slide {slide_number}",
@@ -206,10 +246,14 @@ class NotesNotFoundError(PresentationError):
 class SecurityError(PPTXError):
     """Base class for security-related errors."""
 
+    __slots__ = ()
+
 
 class PathTraversalError(SecurityError):
     """Raised when a path traversal attack is detected."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, **kwargs):
         super().__init__(f"Path traversal detected: {path}", details={"path": path}, **kwargs)
 
@@ -217,6 +261,8 @@ class PathTraversalError(SecurityError):
 class WorkspaceBoundaryError(SecurityError):
     """Raised when file access violates workspace boundaries."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, allowed_dirs: list[str], **kwargs):
         super().__init__(
             f"File access outside workspace boundary: {path}",
@@ -228,6 +274,8 @@ class WorkspaceBoundaryError(SecurityError):
 class UnsafeOperationError(SecurityError):
     """Raised when an operation is deemed unsafe."""
 
+    __slots__ = ()
+
     def __init__(self, operation: str, reason: str, **kwargs):
         super().__init__(
             f"Unsafe operation: {operation}. Reason: {reason}",
@@ -244,10 +292,14 @@ class UnsafeOperationError(SecurityError):
 class ResourceError(PPTXError):
     """Base class for resource management errors."""
 
+    __slots__ = ()
+
 
 class ResourceExhaustedError(ResourceError):
     """Raised when resources are exhausted (memory, cache, etc.)."""
 
+    __slots__ = ()
+
     def __init__(self, resource_type: str, **kwargs):
         super().__init__(
             f"Resource exhausted: {resource_type}",
@@ -259,6 +311,8 @@ class ResourceExhaustedError(ResourceError):
 class OperationTimeoutError(ResourceError):
     """Raised when an operation times out."""
 
+    __slots__ = ()
+
     def __init__(self, operation: str, timeout: int, **kwargs):
         super().__init__(
             f"Operation timed out: {operation} (timeout: {timeout}s)",
@@ -270,6 +324,8 @@ class OperationTimeoutError(ResourceError):
 class RateLimitExceededError(ResourceError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ()
+
     def __init__(self, limit: int, window: str, **kwargs):
         super().__init__(
             f"Rate limit exceeded: {limit} requests per {window}",
@@ -286,14 +342,18 @@ class RateLimitExceededError(ResourceError):
 class IntegrationError(PPTXError):
     """Base class for external integration errors."""
 
+    __slots__ = ()
+
 
 class AzureAPIError(IntegrationError):
     """Raised when Azure API calls fail."""
 
+    __slots__ = ()
+
     def __init__(self, operation: str, status_code: Optional[int] = None, **kwargs):
+        status = f" (status: {status_code})" if status_code else ""
         super().__init__(
-            f"Azure API error during {operation}"
-            + (f" (status: {status_code})" if status_code else ""),
+            f"Azure API error during {operation}{status}",
             details={"operation": operation, "status_code": status_code},
             **kwargs,
         )
@@ -307,10 +367,14 @@ class AzureAPIError(IntegrationError):
 class CacheError(PPTXError):
     """Base class for cache-related errors."""
 
+    __slots__ = ()
+
 
 class CacheMissError(CacheError):
     """Raised when a cache lookup fails."""
 
+    __slots__ = ()
+
     def __init__(self, key: str, **kwargs):
         super().__init__(f"Cache miss for key: {key}", details={"key": key}, **kwargs)
 
@@ -318,6 +382,8 @@ class CacheMissError(CacheError):
 class CacheInvalidationError(CacheError):
     """Raised when cache invalidation fails."""
 
+    __slots__ = ()
+
     def __init__(self, key: str, reason: str, **kwargs):
         super().__init__(
             f"Cache invalidation failed for key: {key}. Reason: {reason}",
@@ -5,7 +5,7 @@ These protocols enable dependency injection and make the codebase more testable
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, List, Mapping, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -67,6 +67,17 @@ class IPPTXHandler(Protocol):
         """
         ...
 
+    def get_slides_content(self, slide_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Get comprehensive content for several slides.
+
+        Args:
+            slide_numbers: Slide numbers (1-indexed)
+
+        Returns:
+            List of slide content dictionaries, in the order requested
+        """
+        ...
+
     def get_notes(self, slide_number: Optional[int] = None) -> Dict[str, Any]:
         """Get speaker notes from slide(s).
 
@@ -207,11 +218,11 @@ class ICache(Protocol):
         """Clear all cached values."""
         ...
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> Mapping[str, Any]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics (hits, misses, size, etc.)
+            Mapping with cache statistics (hits, misses, size, etc.)
         """
         ...
 
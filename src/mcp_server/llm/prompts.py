@@ -2,43 +2,37 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal, Optional
 
+_SUMMARIZE_STYLE_INSTRUCTIONS = {
+    "concise": "Provide a brief, concise summary focusing on the main points.",
+    "detailed": "Provide a comprehensive summary with key details and context.",
+    "bullet_points": "Provide a summary in bullet point format, highlighting key points.",
+}
 
-def get_summarize_prompt(
-    text: str,
-    *,
-    style: Literal["concise", "detailed", "bullet_points"] = "concise",
-    max_words: Optional[int] = None,
-) -> str:
-    """Build a prompt for text summarization."""
-    style_instructions = {
-        "concise": "Provide a brief, concise summary focusing on the main points.",
-        "detailed": "Provide a comprehensive summary with key details and context.",
-        "bullet_points": "Provide a summary in bullet point format, highlighting key points.",
-    }
 
-    style_instruction = style_instructions.get(style, style_instructions["concise"])
+@lru_cache(maxsize=128)
+def _summarize_prefix(style: str, max_words: Optional[int]) -> str:
+    """Everything in the summarize prompt before the text itself."""
+    style_instruction = _SUMMARIZE_STYLE_INSTRUCTIONS.get(
+        style, _SUMMARIZE_STYLE_INSTRUCTIONS["concise"]
+    )
     word_limit = (
         f" The summary should be approximately {max_words} words or less." if max_words else ""
     )
-
     return (
         f"Summarize the following text.{word_limit}\n\n"
         f"{style_instruction}\n\n"
-        f"Text to summarize:\n{text}\n\n"
-        "Summary:"
+        "Text to summarize:\n"
     )
 
 
-def get_translate_prompt(
-    text: str,
-    *,
-    target_lang: str,
-    source_lang: Optional[str] = None,
-    preserve_terms: Optional[list[str]] = None,
+@lru_cache(maxsize=128)
+def _translate_prefix(
+    target_lang: str, source_lang: Optional[str], preserve_terms: tuple[str, ...]
 ) -> str:
-    """Build a prompt for text translation with tone guidance."""
+    """Everything in the translate prompt before the text itself."""
     source_info = f" from {source_lang}" if source_lang else ""
     preserve_info = ""
     if preserve_terms:
@@ -53,11 +47,32 @@ def get_translate_prompt(
         "Maintain the original meaning, tone, and style. If the text contains technical "
         "terms or proper nouns, keep them in their original form unless they have a "
         "standard translation.\n\n"
-        f"Text to translate:\n{text}\n\n"
-        "Translation:"
+        "Text to translate:\n"
     )
 
 
+def get_summarize_prompt(
+    text: str,
+    *,
+    style: Literal["concise", "detailed", "bullet_points"] = "concise",
+    max_words: Optional[int] = None,
+) -> str:
+    """Build a prompt for text summarization."""
+    return f"{_summarize_prefix(style, max_words)}{text}\n\nSummary:"
+
+
+def get_translate_prompt(
+    text: str,
+    *,
+    target_lang: str,
+    source_lang: Optional[str] = None,
+    preserve_terms: Optional[list[str]] = None,
+) -> str:
+    """Build a prompt for text translation with tone guidance."""
+    prefix = _translate_prefix(target_lang, source_lang, tuple(preserve_terms or ()))
+    return f"{prefix}{text}\n\nTranslation:"
+
+
 def get_slide_generate_prompt(
     slide_content: dict,
     *,
@@ -8,6 +8,9 @@ import logging
 import time
 from typing import Any, Callable, Dict, Optional, Protocol, Awaitable
 
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
 from .logging_config import get_logger, set_correlation_id
 from .metrics import MetricsCollector
 from .services import get_registry
@@ -139,9 +142,22 @@ class ValidationMiddleware:
     """Middleware for common input validation.
 
     This middleware validates common parameters before they reach
-    the tool handlers, providing consistent error messages.
+    the tool handlers, providing consistent error messages. When tool
+    input schemas are supplied, arguments are also validated against them
+    using validators compiled once at construction time.
     """
 
+    def __init__(self, tool_schemas: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Initialize validation middleware.
+
+        Args:
+            tool_schemas: Optional mapping of tool name to its JSON input schema
+        """
+        self._schema_validators = {
+            tool_name: validator_for(schema)(schema)
+            for tool_name, schema in (tool_schemas or {}).items()
+        }
+
     async def __call__(
         self,
         name: str,
@@ -179,6 +195,13 @@ class ValidationMiddleware:
             if not pptx_path:
                 raise ValueError("pptx_path cannot be empty")
 
+        # Validate against the tool's precompiled input schema if known
+        schema_validator = self._schema_validators.get(name)
+        if schema_validator is not None:
+            error = best_match(schema_validator.iter_errors(args))
+            if error is not None:
+                raise ValueError(f"Input validation error: {error.message}")
+
         return await next_handler(name, args)
 
 
@@ -7,7 +7,7 @@ and ensure fair resource usage.
 import asyncio
 import logging
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 from .config import get_config
 from .exceptions import PPTXError
@@ -47,37 +47,58 @@ class TokenBucketRateLimiter:
             # Process request
     """
 
-    def __init__(self, rate: int, per: float = 60.0, burst: Optional[int] = None):
+    def __init__(
+        self,
+        rate: int,
+        per: float = 60.0,
+        burst: Optional[int] = None,
+        time_source: Callable[[], float] = time.monotonic,
+    ):
         """Initialize token bucket rate limiter.
 
         Args:
             rate: Number of tokens to add per time period
             per: Time period in seconds (default: 60 seconds)
             burst: Maximum number of tokens in bucket (default: same as rate)
+            time_source: Monotonic clock returning seconds (default: time.monotonic)
         """
         self.rate = rate
         self.per = per
         self.burst = burst or rate
+        self._time_source = time_source
 
         # Token bucket state
         self._tokens = float(self.burst)
-        self._last_update = time.monotonic()
+        self._last_update = time_source()
         self._lock = asyncio.Lock()
 
         logger.info(
             f"Rate limiter initialized: {rate} requests per {per} seconds " f"(burst: {self.burst})"
         )
 
-    def _add_tokens(self) -> None:
-        """Add tokens to the bucket based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self._last_update
+    @staticmethod
+    def _compute_new_tokens(
+        current: float, elapsed: float, rate_per_second: float, burst: int
+    ) -> float:
+        """Compute the token count after refilling for the elapsed time.
 
-        # Calculate tokens to add
-        tokens_to_add = elapsed * (self.rate / self.per)
+        Args:
+            current: Tokens currently in the bucket
+            elapsed: Seconds since the last refill
+            rate_per_second: Tokens added per second
+            burst: Maximum number of tokens in the bucket
 
-        # Update token count (capped at burst limit)
-        self._tokens = min(self.burst, self._tokens + tokens_to_add)
+        Returns:
+            New token count, capped at the burst limit
+        """
+        return min(burst, current + elapsed * rate_per_second)
+
+    def _add_tokens(self) -> None:
+        """Add tokens to the bucket based on elapsed time."""
+        now = self._time_source()
+        self._tokens = self._compute_new_tokens(
+            self._tokens, now - self._last_update, self.rate / self.per, self.burst
+        )
         self._last_update = now
 
     async def acquire(self, tokens: int = 1) -> None:
@@ -142,10 +163,8 @@ class TokenBucketRateLimiter:
             Number of available tokens
         """
         # Note: This is not thread-safe but provides an estimate
-        now = time.monotonic()
-        elapsed = now - self._last_update
-        tokens_to_add = elapsed * (self.rate / self.per)
-        return min(self.burst, self._tokens + tokens_to_add)
+        elapsed = self._time_source() - self._last_update
+        return self._compute_new_tokens(self._tokens, elapsed, self.rate / self.per, self.burst)
 
     def get_wait_time(self, tokens: int = 1) -> float:
         """Get estimated wait time for acquiring tokens.
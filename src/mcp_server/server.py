@@ -1,6 +1,7 @@
 """Main MCP server entry point."""
 
 import asyncio
+import gc
 import logging
 from pathlib import Path
 from typing import Optional
@@ -160,12 +161,29 @@ def register_all_tools():
     logger.info(f"Registered {len(registry.get_registered_tools())} tools")
 
 
+def get_all_tools() -> list[Tool]:
+    """Get all tools exposed by the server."""
+    tools = []
+    tools.extend(get_read_tools())
+    tools.extend(get_edit_tools())
+    tools.extend(get_slide_tools())
+    tools.extend(get_notes_tools())
+    tools.extend(get_text_replace_tools())
+    tools.extend(get_health_tools())
+    if _foundry_ready:
+        tools.extend(get_llm_tools())
+    if _audio_ready:
+        tools.extend(get_transcript_tools())
+    return tools
+
+
 # Initialize middleware pipeline
 def create_middleware_pipeline() -> MiddlewarePipeline:
     """Create the middleware pipeline for tool calls."""
+    tool_schemas = {tool.name: tool.inputSchema for tool in get_all_tools()}
     middlewares = [
         LoggingMiddleware(),
-        ValidationMiddleware(),
+        ValidationMiddleware(tool_schemas=tool_schemas),
         MetricsMiddleware(),
         RateLimiterMiddleware(),
     ]
@@ -180,21 +198,12 @@ middleware_pipeline = create_middleware_pipeline()
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available tools."""
-    tools = []
-    tools.extend(get_read_tools())
-    tools.extend(get_edit_tools())
-    tools.extend(get_slide_tools())
-    tools.extend(get_notes_tools())
-    tools.extend(get_text_replace_tools())
-    tools.extend(get_health_tools())
-    if _foundry_ready:
-        tools.extend(get_llm_tools())
-    if _audio_ready:
-        tools.extend(get_transcript_tools())
-    return tools
+    return get_all_tools()
 
 
-@server.call_tool()
+# Input schemas are validated by ValidationMiddleware with precompiled validators,
+# so skip the SDK's per-call jsonschema.validate.
+@server.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict) -> dict:
     """Handle tool calls using registry and middleware pipeline."""
     logger.info(f"Tool call: {name} with arguments: {arguments}")
@@ -282,6 +291,12 @@ async def main():
         # Initialize services if needed
         # (Cache and metrics are lazily initialized via ServiceRegistry)
 
+        # Config, imported modules and tool definitions live for the whole
+        # process; move them out of the collector's reach so full collections
+        # only scan objects created while serving requests
+        gc.collect()
+        gc.freeze()
+
     except Exception as e:
         logger.error(f"Error during startup: {e}", exc_info=True)
         raise
@@ -83,7 +83,7 @@ async def handle_health_check(arguments: Dict[str, Any]) -> Dict[str, Any]:
             registry = get_registry()
             cache = registry.resolve_optional(PresentationCache)
             if cache:
-                health_status["cache"] = cache.get_stats()
+                health_status["cache"] = dict(cache.get_stats())
             else:
                 health_status["cache"] = {"status": "not initialized"}
         except Exception as e:
@@ -11,6 +11,7 @@ from ..exceptions import ValidationError
 from ..llm.foundry_client import create_response
 from ..llm.prompts import get_summarize_prompt, get_translate_prompt
 from ..llm.slide_generate import generate_slide_content
+from ..utils.async_utils import run_in_thread
 from ..utils.validators import validate_text_input
 
 SummarizeStyle = Literal["concise", "detailed", "bullet_points"]
@@ -165,7 +166,9 @@ async def handle_summarize_text(arguments: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     prompt = get_summarize_prompt(text, style=style, max_words=max_words)
-    summary = create_response(prompt, temperature=temperature, max_output_tokens=max_output_tokens)
+    summary = await run_in_thread(
+        create_response, prompt, temperature=temperature, max_output_tokens=max_output_tokens
+    )
     return {"summary": summary}
 
 
@@ -194,8 +197,8 @@ async def handle_translate_text(arguments: Dict[str, Any]) -> Dict[str, Any]:
         source_lang=source_lang,
         preserve_terms=preserve_terms,
     )
-    translation = create_response(
-        prompt, temperature=temperature, max_output_tokens=max_output_tokens
+    translation = await run_in_thread(
+        create_response, prompt, temperature=temperature, max_output_tokens=max_output_tokens
     )
     return {"translation": translation}
 
@@ -226,7 +229,8 @@ async def handle_generate_slide_content(arguments: Dict[str, Any]) -> Dict[str,
     _validate_output_format(output_format)
     language_value = _validate_language(language, field_name="language")
 
-    result = generate_slide_content(
+    result = await run_in_thread(
+        generate_slide_content,
         slide_content,
         output_format=output_format,
         language=language_value,
@@ -123,19 +123,17 @@ async def handle_read_slide_content(arguments: Dict[str, Any]) -> Dict[str, Any]
         # Return all slides, optionally filtering hidden ones
         if include_hidden:
             # Include all slides without explicit hidden-checks here
-            results = []
             slide_count = await handler.get_slide_count()
-            for i in range(1, slide_count + 1):
-                results.append(await handler.get_slide_content(i))
+            slide_numbers = list(range(1, slide_count + 1))
         else:
             # Use metadata to determine visible slides and avoid duplicate hidden checks
             slides_metadata = await handler.get_slides_metadata(include_hidden=False)
-            results = []
-            for meta in slides_metadata:
-                slide_num = meta.get("slide_number")
-                if slide_num is None:
-                    continue
-                results.append(await handler.get_slide_content(slide_num))
+            slide_numbers = [
+                meta["slide_number"]
+                for meta in slides_metadata
+                if meta.get("slide_number") is not None
+            ]
+        results = await handler.get_slides_content(slide_numbers)
         return {"slides": results}
 
 
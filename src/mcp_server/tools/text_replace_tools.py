@@ -4,6 +4,7 @@ import logging
 import os
 import re
 import tempfile
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -234,8 +235,34 @@ def _replace_in_content(
     max_replacements: int,
     dry_run: bool,
 ) -> Tuple[Presentation, Dict[str, Any]]:
-    """Replace text in slide content shapes."""
-    pres = Presentation(str(pptx_path))
+    """Replace text in slide content shapes of a validated PPTX path."""
+    if not isinstance(pptx_path, Path):
+        raise TypeError(f"pptx_path must be a validated Path, not {type(pptx_path).__name__}")
+    return _replace_in_presentation(
+        Presentation(str(pptx_path)),
+        pattern,
+        replacement,
+        use_regex,
+        regex_flags,
+        slide_number,
+        shape_id,
+        max_replacements,
+        dry_run,
+    )
+
+
+def _replace_in_presentation(
+    pres: Presentation,
+    pattern: str,
+    replacement: str,
+    use_regex: bool,
+    regex_flags: Optional[List[str]],
+    slide_number: Optional[int],
+    shape_id: Optional[int],
+    max_replacements: int,
+    dry_run: bool,
+) -> Tuple[Presentation, Dict[str, Any]]:
+    """Replace text in slide content shapes of an open presentation."""
     max_slides = len(pres.slides)
 
     # Determine which slides to process
@@ -330,7 +357,84 @@ def _replace_in_content(
 
 
 async def handle_replace_text(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle replace_text tool call."""
+    """Handle replace_text tool call.
+
+    Besides the on-disk ``pptx_path`` mode used by MCP clients, in-process callers
+    may pass ``pptx_bytes`` instead of a ``pptx_path``; see ``_replace_text_in_bytes``.
+    """
+    if arguments.get("pptx_bytes") is not None:
+        return await _replace_text_in_bytes(arguments)
+    return await _replace_text_in_file(arguments)
+
+
+async def _replace_text_in_bytes(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace slide content text in an in-memory PPTX.
+
+    This mode is for direct Python callers only: JSON tool calls cannot carry
+    ``bytes``, so any other ``pptx_bytes`` value is rejected rather than treated
+    as a path. Only ``target='slide_content'`` is supported, and the modified
+    presentation is returned as ``output_bytes`` instead of being written to disk.
+    """
+    pptx_bytes = arguments["pptx_bytes"]
+    if not isinstance(pptx_bytes, bytes):
+        return {
+            "success": False,
+            "error": "pptx_bytes must be raw bytes from an in-process caller; "
+            "use pptx_path for files",
+        }
+    if arguments.get("pptx_path"):
+        return {"success": False, "error": "Pass either pptx_path or pptx_bytes, not both"}
+    target = arguments["target"]
+    if target != "slide_content":
+        return {
+            "success": False,
+            "error": "pptx_bytes is only supported for target='slide_content'",
+        }
+    dry_run = arguments.get("dry_run", False)
+
+    try:
+        pres = await run_in_thread(Presentation, BytesIO(pptx_bytes))
+        pres, result = await run_in_thread(
+            _replace_in_presentation,
+            pres,
+            arguments["pattern"],
+            arguments["replacement"],
+            arguments.get("use_regex", False),
+            arguments.get("regex_flags"),
+            arguments.get("slide_number"),
+            arguments.get("shape_id"),
+            arguments.get("max_replacements", 0),
+            dry_run,
+        )
+        summary = {
+            "success": True,
+            "target": target,
+            "slides_scanned": result["slides_scanned"],
+            "slides_changed": result["slides_changed"],
+            "replacements_count": result["total_replacements"],
+            "affected_shapes": [(c["slide_number"], c["shape_id"]) for c in result["changes"]],
+        }
+        if dry_run or result["total_replacements"] == 0:
+            return {
+                **summary,
+                "dry_run": dry_run,
+                "pptx_path": None,
+                "changes": result["changes"],
+            }
+
+        buffer = BytesIO()
+        await run_in_thread(pres.save, buffer)
+        return {**summary, "output_bytes": buffer.getvalue()}
+
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.error(f"Unexpected error in replace_text: {e}", exc_info=True)
+        return {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+
+async def _replace_text_in_file(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace text in a PPTX on disk, in place or to ``output_path``."""
     try:
         # Parse arguments
         pptx_path = validate_pptx_path(arguments["pptx_path"])
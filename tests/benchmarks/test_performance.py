@@ -1,11 +1,19 @@
 """Performance benchmarks for MCP server components."""
 
+import asyncio
+import os
 import time
 
 import pytest
 
 from mcp_server.cache import LRUCache
 from mcp_server.config import get_config, reset_config
+from mcp_server.middleware import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    MiddlewarePipeline,
+    ValidationMiddleware,
+)
 
 
 @pytest.mark.benchmark
@@ -80,6 +88,36 @@ class TestConfigPerformance:
         benchmark(access_config)
 
 
+@pytest.mark.benchmark(group="middleware")
+@pytest.mark.skipif(not os.getenv("RUN_BENCH"), reason="set RUN_BENCH=1 to run")
+class TestMiddlewarePerformance:
+    """Benchmark tests for the tool call middleware pipeline.
+
+    Run with ``RUN_BENCH=1 pytest tests/benchmarks -n 0 --benchmark-autosave`` and
+    compare runs with ``pytest-benchmark compare``.
+    """
+
+    def test_pipeline_execute_performance(self, benchmark):
+        """Benchmark one tool call through the real middlewares."""
+        pipeline = MiddlewarePipeline(
+            [LoggingMiddleware(), ValidationMiddleware(), MetricsMiddleware()]
+        )
+        arguments = {"slide_number": 1, "pptx_path": "/test.pptx"}
+
+        async def handler(name, args):
+            return {"result": "success"}
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = benchmark(
+                lambda: loop.run_until_complete(pipeline.execute("test_tool", arguments, handler))
+            )
+        finally:
+            loop.close()
+
+        assert result == {"result": "success"}
+
+
 def run_performance_report():
     """Generate a performance report."""
     print("\n" + "=" * 70)
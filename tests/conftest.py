@@ -0,0 +1,6 @@
+"""Shared test configuration."""
+
+# Importing python-pptx pulls in lxml and registers all of its part and element
+# classes. Doing it here means each xdist worker pays that cost during
+# collection instead of inside the first test that touches a presentation.
+import pptx  # noqa: F401
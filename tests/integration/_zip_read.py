@@ -0,0 +1,56 @@
+"""Lightweight PPTX readers for verifying test output without python-pptx."""
+
+import re
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from xml.sax.saxutils import unescape
+
+from mcp_server.core.safe_editor import _notes_part_for_slide
+
+_TEXT_RUN_RE = re.compile(r"<a:t[^>]*>([^<]*)</a:t>")
+
+
+def read_notes_text(path: str | Path, slide_number: int) -> str:
+    """Return the concatenated text runs of a slide's notes part.
+
+    Only the slide's relationships part and its notesSlide XML are read from
+    the zip, instead of loading the whole package with ``Presentation()``.
+    Paragraphs are concatenated without separators, so callers should use
+    substring checks rather than exact comparisons.
+
+    Args:
+        path: Path to PPTX file
+        slide_number: Slide number (1-indexed)
+
+    Returns:
+        Notes text, or an empty string if the slide has no notes part
+    """
+    with zipfile.ZipFile(path, "r") as zip_file:
+        notes_part = _notes_part_for_slide(zip_file, slide_number)
+        if notes_part is None:
+            return ""
+        xml_bytes = zip_file.read(notes_part)
+
+    return unescape("".join(_TEXT_RUN_RE.findall(xml_bytes.decode("utf-8"))))
+
+
+def read_slide_text(source: str | Path | bytes, slide_number: int) -> str:
+    """Return the concatenated text runs of a slide part.
+
+    Relies on python-pptx renaming slide parts to ``slide{n}.xml`` in
+    presentation order on save.
+
+    Args:
+        source: Path to PPTX file, or the PPTX file contents
+        slide_number: Slide number (1-indexed)
+
+    Returns:
+        Slide text with paragraphs concatenated without separators
+    """
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    with zipfile.ZipFile(source, "r") as zip_file:
+        xml_bytes = zip_file.read(f"ppt/slides/slide{slide_number}.xml")
+
+    return unescape("".join(_TEXT_RUN_RE.findall(xml_bytes.decode("utf-8"))))
@@ -0,0 +1,22 @@
+"""Shared fixtures for integration tests."""
+
+from io import BytesIO
+from pathlib import Path
+
+import pptx
+import pytest
+from pptx import Presentation
+
+# python-pptx reads and parses templates/default.pptx from disk on every
+# Presentation() call; read the bytes once per session instead.
+_DEFAULT_TEMPLATE_BYTES = (Path(pptx.__file__).parent / "templates" / "default.pptx").read_bytes()
+
+
+@pytest.fixture
+def new_presentation():
+    """Return a factory for blank presentations built from the cached default template."""
+
+    def _new_presentation():
+        return Presentation(BytesIO(_DEFAULT_TEMPLATE_BYTES))
+
+    return _new_presentation
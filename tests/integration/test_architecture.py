@@ -10,8 +10,8 @@ import pytest
 
 # Import from server to trigger tool registration
 import mcp_server.server  # noqa: F401
-from mcp_server.server import middleware_pipeline
-from mcp_server.tools.registry import get_tool_registry
+from mcp_server.server import middleware_pipeline, register_all_tools
+from mcp_server.tools.registry import get_tool_registry, reset_tool_registry
 from mcp_server.config import get_config
 
 
@@ -22,7 +22,10 @@ async def test_architecture_integration():
     config = get_config()
     assert config is not None
 
-    # 2. Tool Registry
+    # 2. Tool Registry. Tests sharing this worker may have reset the global
+    # registry since the server module registered its tools, so rebuild it.
+    reset_tool_registry()
+    register_all_tools()
     registry = get_tool_registry()
     tools = registry.get_registered_tools()
     assert len(tools) == 24, f"Expected 24 tools, got {len(tools)}"
@@ -1,15 +1,21 @@
 import pytest
 import tempfile
 import os
-from pptx import Presentation
 from src.mcp_server.tools.notes_tools import handle_process_notes_workflow
 from src.mcp_server.core.pptx_handler import PPTXHandler
 
 
+def _save_temp_pptx(prs):
+    """Save a presentation to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
+        prs.save(tmp.name)
+        return tmp.name
+
+
 @pytest.fixture
-def test_pptx():
+def pptx_with_notes(new_presentation):
     """Create a test PPTX with 2 slides and note placeholders."""
-    prs = Presentation()
+    prs = new_presentation()
 
     # Slide 1
     slide1 = prs.slides.add_slide(prs.slide_layouts[0])
@@ -22,9 +28,26 @@ def test_pptx():
     notes_slide2 = slide2.notes_slide
     notes_slide2.notes_text_frame.text = "Initial note 2"
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        prs.save(tmp.name)
-        tmp_path = tmp.name
+    tmp_path = _save_temp_pptx(prs)
+
+    yield tmp_path
+
+    if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+
+
+@pytest.fixture
+def pptx_no_notes(new_presentation):
+    """Create a test PPTX with 2 slides and no notes parts.
+
+    Skips materializing the notes slides, which python-pptx builds from its
+    notes master template on first access.
+    """
+    prs = new_presentation()
+    prs.slides.add_slide(prs.slide_layouts[0])
+    prs.slides.add_slide(prs.slide_layouts[1])
+
+    tmp_path = _save_temp_pptx(prs)
 
     yield tmp_path
 
@@ -33,7 +56,7 @@ def test_pptx():
 
 
 @pytest.mark.asyncio
-async def test_process_notes_workflow_vietnamese_policy(test_pptx):
+async def test_process_notes_workflow_vietnamese_policy(pptx_with_notes):
     """Test process_notes_workflow with Vietnamese speaker notes policy."""
 
     # Vietnamese content following the policy:
@@ -53,7 +76,7 @@ async def test_process_notes_workflow_vietnamese_policy(test_pptx):
     ]
 
     result = await handle_process_notes_workflow(
-        {"pptx_path": test_pptx, "notes_data": notes_data, "in_place": True}
+        {"pptx_path": pptx_with_notes, "notes_data": notes_data, "in_place": True}
     )
 
     assert result["success"] is True
@@ -61,7 +84,7 @@ async def test_process_notes_workflow_vietnamese_policy(test_pptx):
     assert result["formatted_slides"] == 1
 
     # Verify the saved content
-    handler = PPTXHandler(test_pptx)
+    handler = PPTXHandler(pptx_with_notes)
     notes = await handler.get_notes(1)
 
     expected_structure = (
@@ -80,7 +103,7 @@ async def test_process_notes_workflow_vietnamese_policy(test_pptx):
 
 
 @pytest.mark.asyncio
-async def test_process_notes_workflow_multi_slide(test_pptx):
+async def test_process_notes_workflow_multi_slide(pptx_with_notes):
     """Test process_notes_workflow with multiple slides."""
 
     notes_data = [
@@ -89,15 +112,39 @@ async def test_process_notes_workflow_multi_slide(test_pptx):
     ]
 
     result = await handle_process_notes_workflow(
-        {"pptx_path": test_pptx, "notes_data": notes_data, "in_place": True}
+        {"pptx_path": pptx_with_notes, "notes_data": notes_data, "in_place": True}
     )
 
     assert result["success"] is True
     assert result["updated_slides"] == 2
 
-    handler = PPTXHandler(test_pptx)
+    handler = PPTXHandler(pptx_with_notes)
     notes1 = await handler.get_notes(1)
     notes2 = await handler.get_notes(2)
 
     assert "Original 1" in notes1["notes"]
     assert "Original 2" in notes2["notes"]
+
+
+@pytest.mark.asyncio
+async def test_process_notes_workflow_without_notes_parts(pptx_no_notes):
+    """Test process_notes_workflow leaves slides without notes parts untouched.
+
+    The zip-based editor only rewrites existing notesSlide parts, so slides
+    that never had notes keep reading back as empty.
+    """
+
+    notes_data = [
+        {"slide_number": 1, "short_text": "Short 1", "original_text": "Original 1"},
+    ]
+
+    result = await handle_process_notes_workflow(
+        {"pptx_path": pptx_no_notes, "notes_data": notes_data, "in_place": True}
+    )
+
+    assert result["success"] is True
+
+    handler = PPTXHandler(pptx_no_notes)
+    notes1 = await handler.get_notes(1)
+
+    assert notes1["notes"] == ""
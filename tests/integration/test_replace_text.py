@@ -2,18 +2,18 @@
 """Unit tests for replace_text tool."""
 
 import tempfile
+from io import BytesIO
 from pathlib import Path
 
 import pytest
-from pptx import Presentation
 from pptx.util import Inches
 
 from mcp_server.tools.text_replace_tools import handle_replace_text
+from tests.integration._zip_read import read_notes_text, read_slide_text
 
 
-def create_test_pptx(path: Path) -> None:
-    """Create a test PPTX file with sample content."""
-    prs = Presentation()
+def create_test_pptx(prs, path: Path | BytesIO) -> None:
+    """Populate a blank presentation with sample content and save it."""
 
     # Slide 1: Title slide with content
     slide1 = prs.slides.add_slide(prs.slide_layouts[0])
@@ -43,15 +43,22 @@ def create_test_pptx(path: Path) -> None:
     text_frame2 = notes_slide2.notes_text_frame
     text_frame2.text = "Second slide notes with some text to find."
 
-    prs.save(str(path))
+    prs.save(path if isinstance(path, BytesIO) else str(path))
 
 
 @pytest.fixture
-def test_pptx_file():
+def test_pptx_file(new_presentation):
     with tempfile.TemporaryDirectory() as tmpdir:
         test_file = Path(tmpdir) / "test.pptx"
-        create_test_pptx(test_file)
-        yield test_file
+        create_test_pptx(new_presentation(), test_file)
+        yield str(test_file)
+
+
+@pytest.fixture
+def test_pptx_bytes(new_presentation):
+    buffer = BytesIO()
+    create_test_pptx(new_presentation(), buffer)
+    return buffer.getvalue()
 
 
 @pytest.mark.asyncio
@@ -60,7 +67,7 @@ async def test_replace_in_notes_literal(test_pptx_file):
     # Perform replacement - note that "test" only appears in slide 1 notes
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": "test",
             "replacement": "sample",
@@ -72,9 +79,8 @@ async def test_replace_in_notes_literal(test_pptx_file):
     assert result.get("success") is True
 
     # Verify changes
-    prs = Presentation(str(test_pptx_file))
-    slide1_notes = prs.slides[0].notes_slide.notes_text_frame.text
-    slide2_notes = prs.slides[1].notes_slide.notes_text_frame.text
+    slide1_notes = read_notes_text(test_pptx_file, 1)
+    slide2_notes = read_notes_text(test_pptx_file, 2)
 
     assert "sample" in slide1_notes, "Replacement not found in slide 1 notes"
     assert "test" not in slide1_notes, "Original text still present in slide 1"
@@ -83,28 +89,61 @@ async def test_replace_in_notes_literal(test_pptx_file):
 
 
 @pytest.mark.asyncio
-async def test_replace_in_content_literal(test_pptx_file):
+async def test_replace_in_content_literal(test_pptx_bytes):
     """Test literal text replacement in slide content."""
-    # Perform replacement
+    # Perform replacement in memory; no file is written
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_bytes": test_pptx_bytes,
             "target": "slide_content",
             "pattern": "Hello",
             "replacement": "Goodbye",
             "use_regex": False,
-            "in_place": True,
         }
     )
 
     assert result.get("success") is True
+    assert result["affected_shapes"]
 
     # Verify changes
-    prs = Presentation(str(test_pptx_file))
-    slide1_title = prs.slides[0].shapes.title.text
+    slide1_text = read_slide_text(result["output_bytes"], 1)
+
+    assert "Goodbye" in slide1_text, "Replacement not found in slide 1 title"
+    assert "Hello" not in slide1_text, "Original text still present"
+
+
+@pytest.mark.asyncio
+async def test_replace_bytes_mode_rejects_notes(test_pptx_bytes):
+    """Test that in-memory mode is limited to slide content."""
+    result = await handle_replace_text(
+        {
+            "pptx_bytes": test_pptx_bytes,
+            "target": "slide_notes",
+            "pattern": "test",
+            "replacement": "sample",
+        }
+    )
 
-    assert "Goodbye" in slide1_title, "Replacement not found in slide 1 title"
-    assert "Hello" not in slide1_title, "Original text still present"
+    assert result.get("success") is False
+    assert "pptx_bytes" in result.get("error", "")
+
+
+@pytest.mark.asyncio
+async def test_replace_bytes_mode_rejects_non_bytes(test_pptx_file):
+    """Test that a path smuggled in as pptx_bytes does not bypass path validation."""
+    result = await handle_replace_text(
+        {
+            "pptx_path": "",
+            "pptx_bytes": test_pptx_file,
+            "target": "slide_content",
+            "pattern": "Hello",
+            "replacement": "Goodbye",
+            "dry_run": True,
+        }
+    )
+
+    assert result.get("success") is False
+    assert "pptx_bytes must be raw bytes" in result.get("error", "")
 
 
 @pytest.mark.asyncio
@@ -113,7 +152,7 @@ async def test_replace_with_regex(test_pptx_file):
     # Perform regex replacement in notes
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": r"(hello)\s+(world)",
             "replacement": r"\2 \1",
@@ -126,8 +165,7 @@ async def test_replace_with_regex(test_pptx_file):
     assert result.get("success") is True
 
     # Verify changes
-    prs = Presentation(str(test_pptx_file))
-    slide1_notes = prs.slides[0].notes_slide.notes_text_frame.text
+    slide1_notes = read_notes_text(test_pptx_file, 1)
 
     assert "world hello" in slide1_notes.lower(), "Regex replacement not applied correctly"
 
@@ -136,13 +174,12 @@ async def test_replace_with_regex(test_pptx_file):
 async def test_dry_run(test_pptx_file):
     """Test dry run mode doesn't modify file."""
     # Get original content
-    prs_before = Presentation(str(test_pptx_file))
-    notes_before = prs_before.slides[0].notes_slide.notes_text_frame.text
+    notes_before = read_notes_text(test_pptx_file, 1)
 
     # Perform dry run
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": "test",
             "replacement": "sample",
@@ -154,8 +191,7 @@ async def test_dry_run(test_pptx_file):
     assert result.get("success") is True
 
     # Verify file wasn't modified
-    prs_after = Presentation(str(test_pptx_file))
-    notes_after = prs_after.slides[0].notes_slide.notes_text_frame.text
+    notes_after = read_notes_text(test_pptx_file, 1)
 
     assert notes_before == notes_after, "File was modified in dry run mode!"
     assert result.get("replacements_count", 0) > 0, "No changes detected"
@@ -168,7 +204,7 @@ async def test_max_replacements(test_pptx_file):
     # Perform replacement with limit using regex (case-insensitive)
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": "hello",
             "replacement": "hi",
@@ -191,7 +227,7 @@ async def test_max_replacements_literal(test_pptx_file):
     # Perform literal replacement with limit (note has "hello" twice)
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": "hello",
             "replacement": "hi",
@@ -207,8 +243,7 @@ async def test_max_replacements_literal(test_pptx_file):
     ), f"Expected 1 replacement, got {result.get('replacements_count')}"
 
     # Verify one "hello" remains
-    prs = Presentation(str(test_pptx_file))
-    notes = prs.slides[0].notes_slide.notes_text_frame.text
+    notes = read_notes_text(test_pptx_file, 1)
     assert "hi" in notes.lower(), "Should have one replacement"
     assert "hello" in notes.lower(), "Should still have one 'hello' remaining"
 
@@ -219,7 +254,7 @@ async def test_specific_slide(test_pptx_file):
     # Perform replacement on slide 1 only - replace "note" with "document"
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": "note",
             "replacement": "document",
@@ -232,9 +267,8 @@ async def test_specific_slide(test_pptx_file):
     assert result.get("success") is True
 
     # Verify only slide 1 was modified
-    prs = Presentation(str(test_pptx_file))
-    slide1_notes = prs.slides[0].notes_slide.notes_text_frame.text
-    slide2_notes = prs.slides[1].notes_slide.notes_text_frame.text
+    slide1_notes = read_notes_text(test_pptx_file, 1)
+    slide2_notes = read_notes_text(test_pptx_file, 2)
 
     assert "document" in slide1_notes, "Slide 1 not modified"
     assert "note" not in slide1_notes, "Original text still in slide 1"
@@ -249,13 +283,12 @@ async def test_output_path(test_pptx_file):
         output_file = Path(tmpdir) / "output.pptx"
 
         # Get original content
-        prs_before = Presentation(str(test_pptx_file))
-        notes_before = prs_before.slides[0].notes_slide.notes_text_frame.text
+        notes_before = read_notes_text(test_pptx_file, 1)
 
         # Perform replacement to new file
         result = await handle_replace_text(
             {
-                "pptx_path": str(test_pptx_file),
+                "pptx_path": test_pptx_file,
                 "target": "slide_notes",
                 "pattern": "test",
                 "replacement": "sample",
@@ -268,15 +301,13 @@ async def test_output_path(test_pptx_file):
         assert result.get("success") is True
 
         # Verify original file unchanged
-        prs_original = Presentation(str(test_pptx_file))
-        notes_original = prs_original.slides[0].notes_slide.notes_text_frame.text
+        notes_original = read_notes_text(test_pptx_file, 1)
 
         assert notes_before == notes_original, "Original file was modified!"
 
         # Verify output file was created and modified
         assert output_file.exists(), "Output file not created!"
-        prs_output = Presentation(str(output_file))
-        notes_output = prs_output.slides[0].notes_slide.notes_text_frame.text
+        notes_output = read_notes_text(output_file, 1)
 
         assert "sample" in notes_output, "Output file not modified correctly"
 
@@ -287,7 +318,7 @@ async def test_error_invalid_regex(test_pptx_file):
     # Test invalid regex pattern
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": r"([unclosed",  # Invalid regex
             "replacement": "test",
@@ -326,7 +357,7 @@ async def test_error_invalid_slide_number(test_pptx_file):
     # Test invalid slide number (file has only 2 slides)
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "slide_notes",
             "pattern": "test",
             "replacement": "sample",
@@ -346,7 +377,7 @@ async def test_error_invalid_target(test_pptx_file):
     # Test invalid target
     result = await handle_replace_text(
         {
-            "pptx_path": str(test_pptx_file),
+            "pptx_path": test_pptx_file,
             "target": "invalid_target",
             "pattern": "test",
             "replacement": "sample",
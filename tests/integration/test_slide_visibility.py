@@ -2,7 +2,6 @@
 
 import tempfile
 import os
-from pptx import Presentation
 
 from mcp_server.core.pptx_handler import PPTXHandler
 
@@ -20,10 +19,10 @@ def temp_pptx():
         os.unlink(path)
 
 
-async def test_is_slide_hidden(temp_pptx):
+async def test_is_slide_hidden(temp_pptx, new_presentation):
     """Test reading hidden status of slides."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     prs.slides.add_slide(prs.slide_layouts[0])  # Slide 1
     prs.slides.add_slide(prs.slide_layouts[1])  # Slide 2
     prs.slides.add_slide(prs.slide_layouts[0])  # Slide 3
@@ -42,10 +41,10 @@ async def test_is_slide_hidden(temp_pptx):
     assert await handler.is_slide_hidden(3) is False, "Slide 3 should be visible"
 
 
-async def test_set_slide_hidden(temp_pptx):
+async def test_set_slide_hidden(temp_pptx, new_presentation):
     """Test setting slide visibility."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     prs.slides.add_slide(prs.slide_layouts[0])  # Slide 1
     prs.slides.add_slide(prs.slide_layouts[1])  # Slide 2
     prs.slides.add_slide(prs.slide_layouts[0])  # Slide 3
@@ -92,10 +91,10 @@ async def test_set_slide_hidden(temp_pptx):
             os.unlink(temp_file2)
 
 
-async def test_get_slides_metadata(temp_pptx):
+async def test_get_slides_metadata(temp_pptx, new_presentation):
     """Test getting metadata for all slides."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     slide1 = prs.slides.add_slide(prs.slide_layouts[0])
     slide2 = prs.slides.add_slide(prs.slide_layouts[1])
     slide3 = prs.slides.add_slide(prs.slide_layouts[0])
@@ -130,10 +129,10 @@ async def test_get_slides_metadata(temp_pptx):
     assert visible_metadata[1]["title"] == "Title 3"
 
 
-async def test_get_slide_content_includes_hidden(temp_pptx):
+async def test_get_slide_content_includes_hidden(temp_pptx, new_presentation):
     """Test that get_slide_content includes hidden status."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     slide1 = prs.slides.add_slide(prs.slide_layouts[0])
     slide1.shapes.title.text = "Test Slide"
 
@@ -151,10 +150,10 @@ async def test_get_slide_content_includes_hidden(temp_pptx):
     assert content["title"] == "Test Slide"
 
 
-async def test_get_presentation_info_includes_visibility_stats(temp_pptx):
+async def test_get_presentation_info_includes_visibility_stats(temp_pptx, new_presentation):
     """Test that presentation info includes visibility statistics."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     prs.slides.add_slide(prs.slide_layouts[0])
     prs.slides.add_slide(prs.slide_layouts[1])
     prs.slides.add_slide(prs.slide_layouts[0])
@@ -2,7 +2,6 @@
 
 import tempfile
 import os
-from pptx import Presentation
 
 from mcp_server.tools.read_tools import (
     handle_read_slide_content,
@@ -26,10 +25,10 @@ def temp_pptx():
 
 
 @pytest.mark.asyncio
-async def test_read_slides_metadata_tool(temp_pptx):
+async def test_read_slides_metadata_tool(temp_pptx, new_presentation):
     """Test read_slides_metadata MCP tool."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     slide1 = prs.slides.add_slide(prs.slide_layouts[0])
     slide2 = prs.slides.add_slide(prs.slide_layouts[1])
     slide3 = prs.slides.add_slide(prs.slide_layouts[0])
@@ -66,10 +65,10 @@ async def test_read_slides_metadata_tool(temp_pptx):
 
 
 @pytest.mark.asyncio
-async def test_read_slide_content_with_hidden(temp_pptx):
+async def test_read_slide_content_with_hidden(temp_pptx, new_presentation):
     """Test read_slide_content includes hidden status."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     slide1 = prs.slides.add_slide(prs.slide_layouts[0])
     slide2 = prs.slides.add_slide(prs.slide_layouts[1])
 
@@ -110,10 +109,10 @@ async def test_read_slide_content_with_hidden(temp_pptx):
 
 
 @pytest.mark.asyncio
-async def test_read_presentation_info_with_visibility(temp_pptx):
+async def test_read_presentation_info_with_visibility(temp_pptx, new_presentation):
     """Test read_presentation_info includes visibility stats."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     prs.slides.add_slide(prs.slide_layouts[0])
     prs.slides.add_slide(prs.slide_layouts[1])
     prs.slides.add_slide(prs.slide_layouts[0])
@@ -138,10 +137,10 @@ async def test_read_presentation_info_with_visibility(temp_pptx):
 
 
 @pytest.mark.asyncio
-async def test_set_slide_visibility_tool(temp_pptx):
+async def test_set_slide_visibility_tool(temp_pptx, new_presentation):
     """Test set_slide_visibility MCP tool."""
     # Create a test presentation
-    prs = Presentation()
+    prs = new_presentation()
     prs.slides.add_slide(prs.slide_layouts[0])
     prs.slides.add_slide(prs.slide_layouts[1])
 
@@ -0,0 +1,62 @@
+"""Shared fixtures for unit tests."""
+
+import hashlib
+import zipfile
+
+import pytest
+
+# Pre-import the modules under test before any unit test module is collected.
+from src.mcp_server.core import safe_editor, video_extractor  # noqa: F401
+from src.mcp_server.tools import transcript_tools  # noqa: F401
+from src.mcp_server.utils import validators  # noqa: F401
+
+_SLIDE_XML = "<p:sld xmlns:p='http://schemas.openxmlformats.org/presentationml/2006/main'></p:sld>"
+_MEDIA_REL = "http://schemas.microsoft.com/office/2007/relationships/media"
+_IMAGE_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+_VIDEO_SLIDE_RELS = f"""<?xml version="1.0" encoding="UTF-8"?>
+    <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+        <Relationship Id="rId1" Type="{_MEDIA_REL}" Target="../media/video1.mp4"/>
+        <Relationship Id="rId2" Type="{_MEDIA_REL}" Target="http://example.com/video.mp4" TargetMode="External"/>
+        <Relationship Id="rId3" Type="{_IMAGE_REL}" Target="../media/image1.png"/>
+    </Relationships>
+    """  # noqa: E501
+
+
+@pytest.fixture(scope="session")
+def pptx_archive_factory(tmp_path_factory):
+    """Return a builder that writes a zip archive once per distinct set of entries.
+
+    Archives are keyed by a SHA-256 of their entry names and contents, so
+    requesting the same entries again returns the existing file.
+    """
+    archives = {}
+
+    def _build(entries, name="archive.pptx"):
+        digest = hashlib.sha256()
+        for entry_name, data in entries.items():
+            if isinstance(data, str):
+                data = data.encode()
+            digest.update(entry_name.encode() + b"\0" + data + b"\0")
+        key = digest.hexdigest()
+        if key not in archives:
+            path = tmp_path_factory.mktemp(key[:12]) / name
+            with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as archive:
+                for entry_name, data in entries.items():
+                    archive.writestr(entry_name, data)
+            archives[key] = path
+        return archives[key]
+
+    return _build
+
+
+@pytest.fixture(scope="session")
+def minimal_video_pptx(pptx_archive_factory):
+    """Archive whose slide 1 links one embedded video, one external video and one image."""
+    return pptx_archive_factory(
+        {
+            "ppt/slides/slide1.xml": _SLIDE_XML,
+            "ppt/slides/_rels/slide1.xml.rels": _VIDEO_SLIDE_RELS,
+            "ppt/media/video1.mp4": b"video-bytes",
+        },
+        name="video_demo.pptx",
+    )
@@ -3,9 +3,24 @@
 import time
 from threading import Thread
 
+import pytest
+
 from mcp_server.cache import LRUCache, PresentationCache
 
 
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, seconds):
+        self.now += seconds
+
+
 class TestLRUCache:
     """Tests for LRUCache class."""
 
@@ -47,14 +62,15 @@ class TestLRUCache:
 
     def test_ttl_expiration(self):
         """Test TTL-based expiration."""
-        cache = LRUCache(maxsize=10, default_ttl=1)
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, default_ttl=1, time_func=clock)
         cache.set("key1", "value1", ttl=1)
 
         # Should be available immediately
         assert cache.get("key1") == "value1"
 
         # Wait for expiration
-        time.sleep(1.1)
+        clock.tick(1.1)
 
         # Should be expired now
         assert cache.get("key1") is None
@@ -107,6 +123,20 @@ class TestLRUCache:
         assert stats["size"] == 1
         assert stats["hit_rate"] == 0.5
 
+    def test_stats_view_is_read_only_and_reused(self):
+        """Test that get_stats returns one read-only view refreshed in place."""
+        cache = LRUCache(maxsize=10)
+        stats = cache.get_stats()
+        assert stats["hits"] == 0
+
+        cache.set("key1", "value1")
+        cache.get("key1")
+
+        assert cache.get_stats() is stats
+        assert stats["hits"] == 1
+        with pytest.raises(TypeError):
+            stats["hits"] = 0
+
     def test_eviction_tracking(self):
         """Test eviction tracking in statistics."""
         cache = LRUCache(maxsize=2)
@@ -140,19 +170,45 @@ class TestLRUCache:
         stats = cache.get_stats()
         assert stats["size"] <= 100
 
+    def test_sharded_cache_respects_maxsize(self):
+        """Test that maxsize bounds the total across shards."""
+        cache = LRUCache(maxsize=64)
+        assert len(cache._shards) > 1
+
+        for i in range(200):
+            cache.set(f"key{i}", f"value{i}")
+
+        stats = cache.get_stats()
+        assert stats["size"] == 64
+        assert stats["evictions"] == 136
+        assert cache.get("key199") == "value199"
+
     def test_cleanup_expired(self):
         """Test cleaning up expired entries."""
-        cache = LRUCache(maxsize=10)
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, time_func=clock)
         cache.set("key1", "value1", ttl=1)
         cache.set("key2", "value2", ttl=10)
 
-        time.sleep(1.1)
+        clock.tick(1.1)
 
         removed = cache.cleanup_expired()
         assert removed == 1
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
 
+    def test_cleanup_expired_skips_reset_entries(self):
+        """Test that re-setting a key with a longer TTL keeps it alive."""
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, time_func=clock)
+        cache.set("key1", "value1", ttl=1)
+        cache.set("key1", "value1b", ttl=10)
+
+        clock.tick(1.1)
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get("key1") == "value1b"
+
 
 class TestPresentationCache:
     """Tests for PresentationCache class."""
@@ -165,7 +221,7 @@ class TestPresentationCache:
 
     def test_cache_key_includes_mtime(self, tmp_path):
         """Test cache key includes modification time."""
-        cache = PresentationCache()
+        cache = PresentationCache(stat_ttl=0)
         test_file = tmp_path / "test.pptx"
         test_file.write_text("test content")
 
@@ -183,6 +239,45 @@ class TestPresentationCache:
         # Should not find cached version (mtime changed)
         assert cache.get_presentation(test_file) is None
 
+    def test_stat_reused_within_ttl(self, tmp_path):
+        """Test that a recent stat result is reused until invalidated."""
+        cache = PresentationCache(stat_ttl=60)
+        test_file = tmp_path / "test.pptx"
+        test_file.write_text("test content")
+
+        cache.cache_presentation(test_file, "MockPresentation")
+        test_file.write_text("modified content")
+
+        # Remembered stat still matches the cached entry
+        assert cache.get_presentation(test_file) == "MockPresentation"
+
+        # Invalidate drops the entry and forces a fresh stat
+        cache.invalidate(test_file)
+        assert cache.get_presentation(test_file) is None
+
+    def test_expired_stats_are_pruned(self, tmp_path):
+        """Test that stat results older than stat_ttl are dropped, not kept forever."""
+        clock = FakeClock()
+        cache = PresentationCache(stat_ttl=1.0, time_func=clock)
+        first = tmp_path / "first.pptx"
+        second = tmp_path / "second.pptx"
+        first.write_text("first")
+        second.write_text("second")
+
+        cache.get_presentation(first)
+        clock.tick(0.5)
+        cache.get_presentation(second)
+        assert list(cache._stat_cache) == [str(first), str(second)]
+
+        # Looking up any path prunes every expired entry, including other files
+        clock.tick(0.6)
+        cache.get_presentation(second)
+        assert list(cache._stat_cache) == [str(second)]
+
+        clock.tick(1.0)
+        cache.get_presentation(tmp_path / "missing.pptx")
+        assert not cache._stat_cache
+
     def test_invalidate(self, tmp_path):
         """Test invalidating cached presentation."""
         cache = PresentationCache()
@@ -2,6 +2,7 @@
 
 import os
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 
 from mcp_server.config import (
@@ -122,6 +123,17 @@ class TestConfig:
         config = Config.from_env()
         assert config.logging.level == "DEBUG"
 
+    def test_from_env_audio_fallbacks(self, clean_env, monkeypatch):
+        """Test audio settings fall back to SPEECH_* variables."""
+        for key in ("AUDIO_KEY", "AUDIO_REGION", "SPEECH_KEY", "SPEECH_REGION"):
+            monkeypatch.delenv(key, raising=False)
+        monkeypatch.setenv("AUDIO_KEY", "")
+        monkeypatch.setenv("SPEECH_KEY", "speech-key")
+        monkeypatch.setenv("SPEECH_REGION", "westeurope")
+        config = Config.from_env()
+        assert config.audio_key == "speech-key"
+        assert config.audio_region == "westeurope"
+
     def test_validate_success(self):
         """Test successful validation."""
         config = Config()
@@ -130,24 +142,35 @@ class TestConfig:
     def test_validate_invalid_max_file_size(self):
         """Test validation fails for invalid max file size."""
         config = Config()
-        config.security.max_file_size = -1
         with pytest.raises(ValueError, match="Invalid max_file_size"):
-            config.validate()
+            config.replace(security=replace(config.security, max_file_size=-1))
 
     def test_validate_invalid_cache_size(self):
         """Test validation fails for invalid cache size."""
         config = Config()
-        config.performance.cache_size = -1
         with pytest.raises(ValueError, match="Invalid cache_size"):
-            config.validate()
+            config.replace(performance=replace(config.performance, cache_size=-1))
 
     def test_validate_invalid_log_level(self):
         """Test validation fails for invalid log level."""
         config = Config()
-        config.logging.level = "INVALID"
         with pytest.raises(ValueError, match="Invalid log level"):
+            config.replace(logging=replace(config.logging, level="INVALID"))
+
+    def test_validate_missing_workspace_dir(self, tmp_path):
+        """Test validate checks that workspace directories exist."""
+        config = Config(security=SecurityConfig(workspace_dirs=[tmp_path / "missing"]))
+        with pytest.raises(ValueError, match="Workspace directory does not exist"):
             config.validate()
 
+    def test_config_is_frozen(self):
+        """Test configuration objects cannot be mutated in place."""
+        config = Config()
+        with pytest.raises(FrozenInstanceError):
+            config.security.max_file_size = 1
+        assert config.replace(enable_metrics=True).enable_metrics is True
+        assert config.enable_metrics is False
+
 
 class TestGlobalConfig:
     """Tests for global configuration management."""
@@ -160,8 +183,7 @@ class TestGlobalConfig:
 
     def test_set_config(self, clean_env):
         """Test setting global configuration."""
-        custom_config = Config()
-        custom_config.environment = Environment.PRODUCTION
+        custom_config = Config(environment=Environment.PRODUCTION)
         set_config(custom_config)
 
         retrieved_config = get_config()
@@ -177,8 +199,9 @@ class TestGlobalConfig:
 
     def test_set_config_validates(self, clean_env):
         """Test set_config validates configuration."""
-        invalid_config = Config()
-        invalid_config.security.max_file_size = -1
+        invalid_config = Config(
+            security=SecurityConfig(workspace_dirs=[Path("/nonexistent/workspace")])
+        )
 
         with pytest.raises(ValueError):
             set_config(invalid_config)
@@ -62,6 +62,11 @@ class TestPPTXError:
         assert "cause" in error_dict
         assert error_dict["cause"] == "Original error"
 
+    def test_to_dict_subclass_error_type(self):
+        """Test subclasses report their own class name."""
+        error = InvalidSlideNumberError(15, 10)
+        assert error.to_dict()["error_type"] == "InvalidSlideNumberError"
+
 
 class TestValidationErrors:
     """Tests for validation error classes."""
@@ -1,48 +1,58 @@
 import base64
+import io
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from src.mcp_server.core import image_extractor
 from src.mcp_server.core.image_extractor import (
+    _probe_header,
     extract_images_from_pptx,
     extract_image_as_base64,
     extract_slide_images,
+    open_pptx_archive,
 )
 
 
 @patch("src.mcp_server.core.image_extractor.validate_pptx_path")
-@patch("zipfile.ZipFile")
-@patch("PIL.Image.open")
-def test_extract_images_from_pptx(mock_image_open, mock_zip_class, mock_validate_path):
+@patch("src.mcp_server.core.image_extractor._open_zip")
+@patch("src.mcp_server.core.image_extractor._probe_image")
+def test_extract_images_from_pptx(mock_probe_image, mock_open_zip, mock_validate_path):
     mock_validate_path.return_value = Path("test.pptx")
-    mock_zip = mock_zip_class.return_value.__enter__.return_value
+    mock_zip = mock_open_zip.return_value.__enter__.return_value
 
     # Mock image file in zip
     item = MagicMock()
     item.filename = "ppt/media/image1.png"
+    item.file_size = 15
     mock_zip.infolist.return_value = [item]
-    mock_zip.read.return_value = b"fake image data"
+    mock_zip.open.return_value = io.BytesIO(b"fake image data")
 
-    # Mock PIL Image
-    mock_img = MagicMock()
-    mock_img.size = (100, 200)
-    mock_img.format = "PNG"
-    mock_image_open.return_value = mock_img
+    # Header is not a known format, so the full probe runs
+    mock_probe_image.return_value = (100, 200, "PNG")
 
     result = extract_images_from_pptx("test.pptx")
 
+    mock_probe_image.assert_called_once_with(b"fake image data")
     assert len(result) == 1
     assert result[0]["filename"] == "image1.png"
+    assert result[0]["size"] == 15
     assert result[0]["width"] == 100
     assert result[0]["height"] == 200
     assert result[0]["format"] == "PNG"
 
 
 @patch("src.mcp_server.core.image_extractor.validate_pptx_path")
-@patch("zipfile.ZipFile")
-def test_extract_image_as_base64(mock_zip_class, mock_validate_path):
+@patch("src.mcp_server.core.image_extractor._open_zip")
+def test_extract_image_as_base64(mock_open_zip, mock_validate_path):
     mock_validate_path.return_value = Path("test.pptx")
-    mock_zip = mock_zip_class.return_value.__enter__.return_value
+    mock_zip = mock_open_zip.return_value.__enter__.return_value
 
-    mock_zip.read.return_value = b"hello"
+    mock_zip.getinfo.return_value.file_size = 5
+    mock_zip.open.return_value = io.BytesIO(b"hello")
 
     result = extract_image_as_base64("test.pptx", "ppt/media/image1.png")
 
@@ -50,12 +60,26 @@ def test_extract_image_as_base64(mock_zip_class, mock_validate_path):
     assert result == expected
 
 
+def test_extract_image_as_base64_multiple_chunks(tmp_path):
+    pptx_file = tmp_path / "test.pptx"
+    image_data = bytes(range(256)) * 1000
+    with zipfile.ZipFile(pptx_file, "w") as zip_file:
+        zip_file.writestr("ppt/media/image1.png", image_data)
+
+    with patch("src.mcp_server.core.image_extractor.validate_pptx_path", return_value=pptx_file):
+        result = extract_image_as_base64(pptx_file, "ppt/media/image1.png")
+        missing = extract_image_as_base64(pptx_file, "ppt/media/missing.png")
+
+    assert result == base64.b64encode(image_data).decode("utf-8")
+    assert missing is None
+
+
 @patch("src.mcp_server.core.image_extractor.validate_pptx_path")
 @patch("src.mcp_server.core.image_extractor.validate_slide_number")
 @patch("pptx.Presentation")
-@patch("PIL.Image.open")
+@patch("src.mcp_server.core.image_extractor._probe_image")
 async def test_extract_slide_images(
-    mock_image_open, mock_pres_class, mock_validate_slide, mock_validate_path
+    mock_probe_image, mock_pres_class, mock_validate_slide, mock_validate_path
 ):
     mock_validate_path.return_value = Path("test.pptx")
 
@@ -72,11 +96,7 @@ async def test_extract_slide_images(
     mock_shape.height = 100
     mock_slide.shapes = [mock_shape]
 
-    # Mock PIL Image
-    mock_img = MagicMock()
-    mock_img.size = (50, 50)
-    mock_img.format = "JPEG"
-    mock_image_open.return_value = mock_img
+    mock_probe_image.return_value = (50, 50, "JPEG")
 
     result = await extract_slide_images("test.pptx", 1)
 
@@ -84,3 +104,47 @@ async def test_extract_slide_images(
     assert result[0]["shape_id"] == 10
     assert result[0]["image_width"] == 50
     assert result[0]["format"] == "JPEG"
+
+
+@pytest.mark.parametrize("pil_format", ["PNG", "JPEG", "GIF", "BMP"])
+def test_probe_header_matches_pil(pil_format):
+    buffer = io.BytesIO()
+    Image.new("RGB", (37, 21)).save(buffer, format=pil_format)
+
+    assert _probe_header(buffer.getvalue()) == (37, 21, pil_format)
+
+
+def test_probe_header_unknown_format():
+    assert _probe_header(b"fake image data") is None
+
+
+def test_open_pptx_archive_shares_handle_and_releases_it(tmp_path, monkeypatch):
+    pptx_file = tmp_path / "test.pptx"
+    with zipfile.ZipFile(pptx_file, "w") as zip_file:
+        zip_file.writestr("ppt/media/image1.gif", b"GIF89a\x02\x00\x03\x00")
+    monkeypatch.setattr(image_extractor, "validate_pptx_path", lambda path: Path(path))
+
+    opened = []
+    real_zipfile = zipfile.ZipFile
+
+    def counting_zipfile(*args, **kwargs):
+        archive = real_zipfile(*args, **kwargs)
+        opened.append(archive)
+        return archive
+
+    monkeypatch.setattr(image_extractor.zipfile, "ZipFile", counting_zipfile)
+
+    with open_pptx_archive(pptx_file) as archive:
+        images = extract_images_from_pptx(pptx_file, zip_file=archive)
+        encoded = extract_image_as_base64(pptx_file, images[0]["path"], zip_file=archive)
+
+    assert images[0]["width"] == 2 and images[0]["height"] == 3
+    assert encoded == base64.b64encode(b"GIF89a\x02\x00\x03\x00").decode("ascii")
+    # One handle served the whole batch and was closed when the block exited
+    assert opened == [archive]
+    assert archive.fp is None
+
+    # Without a session, each call opens and closes its own handle
+    extract_image_as_base64(pptx_file, "ppt/media/image1.gif")
+    assert len(opened) == 2
+    assert opened[1].fp is None
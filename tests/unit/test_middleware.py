@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import logging
 from unittest.mock import patch
 
 from mcp_server.middleware import (
@@ -11,8 +12,51 @@ from mcp_server.middleware import (
     MiddlewarePipeline,
 )
 
+# Most tests don't assert on log output, so drop records as cheaply as possible;
+# tests that do use the middleware_logs fixture to capture INFO records.
+TEST_LOGGER = logging.getLogger("test_middleware")
+TEST_LOGGER.addHandler(logging.NullHandler())
+TEST_LOGGER.setLevel(logging.WARNING)
+TEST_LOGGER.propagate = False
+
 
 @pytest.fixture
+def middleware_logs(caplog):
+    """Capture INFO records from TEST_LOGGER, which does not propagate to caplog's root handler."""
+    caplog.set_level(logging.INFO, logger=TEST_LOGGER.name)
+    TEST_LOGGER.addHandler(caplog.handler)
+    yield caplog
+    TEST_LOGGER.removeHandler(caplog.handler)
+
+
+def make_tracking_middleware(calls, tag):
+    """Create a middleware that records when it runs before and after the handler."""
+
+    async def middleware(name, args, next_handler):
+        calls.append(f"{tag}_before")
+        result = await next_handler(name, args)
+        calls.append(f"{tag}_after")
+        return result
+
+    return middleware
+
+
+async def modifier_middleware(name, args, next_handler):
+    """Middleware that marks the handler's result as modified."""
+    result = await next_handler(name, args)
+    result["modified"] = True
+    return result
+
+
+async def error_catching_middleware(name, args, next_handler):
+    """Middleware that turns a ValueError into an error result."""
+    try:
+        return await next_handler(name, args)
+    except ValueError:
+        return {"error": "caught"}
+
+
+@pytest.fixture(scope="module")
 def mock_handler():
     """Create a mock handler that returns a result."""
 
@@ -22,7 +66,7 @@ def mock_handler():
     return handler
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def error_handler():
     """Create a mock handler that raises an error."""
 
@@ -32,34 +76,35 @@ def error_handler():
     return handler
 
 
+@pytest.fixture(scope="module")
+def real_pipeline():
+    """Pipeline built from the real middleware implementations."""
+    return MiddlewarePipeline([LoggingMiddleware(), ValidationMiddleware(), MetricsMiddleware()])
+
+
 class TestLoggingMiddleware:
     """Tests for LoggingMiddleware."""
 
     @pytest.mark.asyncio
-    async def test_logs_tool_call(self, mock_handler):
+    async def test_logs_tool_call(self, mock_handler, middleware_logs):
         """Test that logging middleware logs tool calls."""
-        import logging
-
-        test_logger = logging.getLogger("test_middleware")
-        test_logger.setLevel(logging.INFO)
-
-        middleware = LoggingMiddleware(logger_instance=test_logger)
+        middleware = LoggingMiddleware(logger_instance=TEST_LOGGER)
 
         with patch("mcp_server.middleware.set_correlation_id") as mock_set_corr:
             mock_set_corr.return_value = "test-corr-id"
             result = await middleware("test_tool", {"key": "value"}, mock_handler)
 
         assert result == {"result": "success", "tool": "test_tool", "args": {"key": "value"}}
+        started = middleware_logs.records[0]
+        assert started.levelno == logging.INFO
+        assert started.getMessage() == "Tool call started: test_tool"
+        assert started.correlation_id == "test-corr-id"
+        assert started.tool_args == {"key": "value"}
 
     @pytest.mark.asyncio
     async def test_logs_errors(self, error_handler):
         """Test that logging middleware logs errors."""
-        import logging
-
-        test_logger = logging.getLogger("test_middleware_error")
-        test_logger.setLevel(logging.INFO)
-
-        middleware = LoggingMiddleware(logger_instance=test_logger)
+        middleware = LoggingMiddleware(logger_instance=TEST_LOGGER)
 
         with patch("mcp_server.middleware.set_correlation_id") as mock_set_corr:
             mock_set_corr.return_value = "test-corr-id"
@@ -78,14 +123,9 @@ class TestLoggingMiddleware:
             mock_set_corr.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_timing_logged(self, mock_handler):
+    async def test_timing_logged(self, mock_handler, middleware_logs):
         """Test that execution time is logged."""
-        import logging
-
-        test_logger = logging.getLogger("test_middleware_timing")
-        test_logger.setLevel(logging.INFO)
-
-        middleware = LoggingMiddleware(logger_instance=test_logger)
+        middleware = LoggingMiddleware(logger_instance=TEST_LOGGER)
 
         # Add delay to handler
         async def delayed_handler(name, args):
@@ -96,6 +136,12 @@ class TestLoggingMiddleware:
             mock_set_corr.return_value = "test-corr-id"
             await middleware("test_tool", {}, delayed_handler)
 
+        completed = middleware_logs.records[-1]
+        assert completed.levelno == logging.INFO
+        assert completed.getMessage().startswith("Tool call completed: test_tool")
+        assert completed.success is True
+        assert completed.elapsed_ms > 0
+
 
 class TestValidationMiddleware:
     """Tests for ValidationMiddleware."""
@@ -152,6 +198,29 @@ class TestValidationMiddleware:
 
         assert result["result"] == "success"
 
+    @pytest.mark.asyncio
+    async def test_validates_against_tool_schema(self, mock_handler):
+        """Test that arguments are checked against the tool's input schema."""
+        middleware = ValidationMiddleware(
+            tool_schemas={
+                "test_tool": {
+                    "type": "object",
+                    "properties": {"pptx_path": {"type": "string"}},
+                    "required": ["pptx_path"],
+                }
+            }
+        )
+
+        with pytest.raises(ValueError, match="Input validation error: 'pptx_path'"):
+            await middleware("test_tool", {"other_field": "value"}, mock_handler)
+
+        result = await middleware("test_tool", {"pptx_path": "/path/to/file.pptx"}, mock_handler)
+        assert result["result"] == "success"
+
+        # Tools without a known schema pass through
+        result = await middleware("other_tool", {}, mock_handler)
+        assert result["result"] == "success"
+
 
 class TestMetricsMiddleware:
     """Tests for MetricsMiddleware."""
@@ -178,8 +247,11 @@ class TestMetricsMiddleware:
 
         # Mock the metrics collector
         with patch.object(middleware, "metrics_collector") as mock_collector:
-            with pytest.raises(ValueError):
+            try:
                 await middleware("test_tool", {}, error_handler)
+                pytest.fail("Should have raised ValueError")
+            except ValueError:
+                pass
 
             mock_collector.record_operation.assert_called_once()
             call_args = mock_collector.record_operation.call_args
@@ -203,36 +275,20 @@ class TestMiddlewarePipeline:
         """Test executing pipeline with single middleware."""
         calls = []
 
-        async def tracking_middleware(name, args, next_handler):
-            calls.append("before")
-            result = await next_handler(name, args)
-            calls.append("after")
-            return result
-
-        pipeline = MiddlewarePipeline([tracking_middleware])
+        pipeline = MiddlewarePipeline([make_tracking_middleware(calls, "m1")])
         result = await pipeline.execute("test_tool", {}, mock_handler)
 
         assert result["result"] == "success"
-        assert calls == ["before", "after"]
+        assert calls == ["m1_before", "m1_after"]
 
     @pytest.mark.asyncio
     async def test_executes_multiple_middlewares_in_order(self, mock_handler):
         """Test that middlewares execute in order."""
         calls = []
 
-        async def middleware1(name, args, next_handler):
-            calls.append("m1_before")
-            result = await next_handler(name, args)
-            calls.append("m1_after")
-            return result
-
-        async def middleware2(name, args, next_handler):
-            calls.append("m2_before")
-            result = await next_handler(name, args)
-            calls.append("m2_after")
-            return result
-
-        pipeline = MiddlewarePipeline([middleware1, middleware2])
+        pipeline = MiddlewarePipeline(
+            [make_tracking_middleware(calls, "m1"), make_tracking_middleware(calls, "m2")]
+        )
         await pipeline.execute("test_tool", {}, mock_handler)
 
         # Middlewares should execute in order: m1 -> m2 -> handler -> m2 -> m1
@@ -241,12 +297,6 @@ class TestMiddlewarePipeline:
     @pytest.mark.asyncio
     async def test_middleware_can_modify_result(self, mock_handler):
         """Test that middleware can modify results."""
-
-        async def modifier_middleware(name, args, next_handler):
-            result = await next_handler(name, args)
-            result["modified"] = True
-            return result
-
         pipeline = MiddlewarePipeline([modifier_middleware])
         result = await pipeline.execute("test_tool", {}, mock_handler)
 
@@ -255,13 +305,6 @@ class TestMiddlewarePipeline:
     @pytest.mark.asyncio
     async def test_middleware_can_catch_errors(self, error_handler):
         """Test that middleware can catch and handle errors."""
-
-        async def error_catching_middleware(name, args, next_handler):
-            try:
-                return await next_handler(name, args)
-            except ValueError:
-                return {"error": "caught"}
-
         pipeline = MiddlewarePipeline([error_catching_middleware])
         result = await pipeline.execute("test_tool", {}, error_handler)
 
@@ -276,13 +319,9 @@ class TestMiddlewarePipeline:
         assert result == {"result": "success", "tool": "test_tool", "args": {"key": "value"}}
 
     @pytest.mark.asyncio
-    async def test_integration_with_real_middlewares(self, mock_handler):
+    async def test_integration_with_real_middlewares(self, real_pipeline, mock_handler):
         """Test pipeline with actual middleware implementations."""
-        pipeline = MiddlewarePipeline(
-            [LoggingMiddleware(), ValidationMiddleware(), MetricsMiddleware()]
-        )
-
-        result = await pipeline.execute(
+        result = await real_pipeline.execute(
             "test_tool", {"slide_number": 1, "pptx_path": "/test.pptx"}, mock_handler
         )
 
@@ -1,34 +1,51 @@
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from src.mcp_server.core.pptx_handler import PPTXHandler
 
 
-@pytest.fixture
-def mock_config():
-    with patch("src.mcp_server.core.pptx_handler.get_config") as mock:
-        config = MagicMock()
-        config.performance.enable_cache = False
-        mock.return_value = config
-        yield config
+class FakeElement:
+    """Minimal stand-in for an lxml element's attribute API."""
 
+    def __init__(self, **attrib):
+        self.attrib = dict(attrib)
 
-@pytest.fixture
-def mock_validate_path():
-    with patch("src.mcp_server.core.pptx_handler.validate_pptx_path") as mock:
-        mock.return_value = Path("test.pptx")
-        yield mock
+    def get(self, key, default=None):
+        return self.attrib.get(key, default)
 
+    def set(self, key, value):
+        self.attrib[key] = value
 
-@patch("pptx.Presentation")
-def test_handler_init(mock_pres, mock_validate_path, mock_config):
+
+def make_slide(**kwargs):
+    """Build a slide stub with only the attributes a test needs."""
+    kwargs.setdefault("element", FakeElement())
+    return SimpleNamespace(**kwargs)
+
+
+FAKE_CONFIG = SimpleNamespace(performance=SimpleNamespace(enable_cache=False))
+
+
+@pytest.fixture(autouse=True)
+def mock_pres_class(monkeypatch):
+    """Stub out config, path validation and Presentation loading for every test."""
+    pres_class = MagicMock()
+    monkeypatch.setattr("src.mcp_server.core.pptx_handler.Presentation", pres_class)
+    monkeypatch.setattr(
+        "src.mcp_server.core.pptx_handler.validate_pptx_path", lambda path: Path("test.pptx")
+    )
+    monkeypatch.setattr("src.mcp_server.core.pptx_handler.get_config", lambda: FAKE_CONFIG)
+    return pres_class
+
+
+def test_handler_init():
     handler = PPTXHandler("test.pptx")
     assert handler.pptx_path == Path("test.pptx")
     assert handler._presentation is None
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-def test_handler_lazy_load(mock_pres_class, mock_validate_path, mock_config):
+def test_handler_lazy_load(mock_pres_class):
     handler = PPTXHandler("test.pptx")
     mock_pres = mock_pres_class.return_value
 
@@ -43,81 +60,70 @@ def test_handler_lazy_load(mock_pres_class, mock_validate_path, mock_config):
     assert pres2 == mock_pres
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-async def test_get_slide_count(mock_pres_class, mock_validate_path, mock_config):
+async def test_get_slide_count():
     handler = PPTXHandler("test.pptx")
-    handler.presentation.slides = [MagicMock(), MagicMock()]
+    handler.presentation.slides = [make_slide(), make_slide()]
     assert await handler.get_slide_count() == 2
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-async def test_is_slide_hidden(mock_pres_class, mock_validate_path, mock_config):
+async def test_is_slide_hidden():
     handler = PPTXHandler("test.pptx")
-    mock_slide = MagicMock()
-    handler.presentation.slides = [mock_slide]
+    slide = make_slide(element=FakeElement(show="0"))
+    handler.presentation.slides = [slide]
 
     # Hidden
-    mock_slide.element.get.return_value = "0"
     assert await handler.is_slide_hidden(1) is True
 
-    # Visible (missing show attr)
-    mock_slide.element.get.return_value = None
+    # Visible (missing show attr); reload to rebuild the cached hidden mask
+    slide.element.attrib.clear()
+    handler.reload()
     assert await handler.is_slide_hidden(1) is False
 
     # Visible (show="1")
-    mock_slide.element.get.return_value = "1"
+    slide.element.set("show", "1")
+    handler.reload()
     assert await handler.is_slide_hidden(1) is False
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-async def test_set_slide_hidden(mock_pres_class, mock_validate_path, mock_config):
+async def test_set_slide_hidden():
     handler = PPTXHandler("test.pptx")
-    mock_slide = MagicMock()
-    handler.presentation.slides = [mock_slide]
+    slide = make_slide()
+    handler.presentation.slides = [slide]
+
+    assert await handler.is_slide_hidden(1) is False
 
     # Set to hidden
     await handler.set_slide_hidden(1, True)
-    mock_slide.element.set.assert_called_with("show", "0")
+    assert slide.element.attrib == {"show": "0"}
     assert handler._is_modified is True
+    assert await handler.is_slide_hidden(1) is True
 
     # Set to visible
-    mock_slide.element.attrib = {"show": "0"}
     await handler.set_slide_hidden(1, False)
-    assert "show" not in mock_slide.element.attrib
+    assert "show" not in slide.element.attrib
+    assert await handler.is_slide_hidden(1) is False
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-async def test_get_slide_text(mock_pres_class, mock_validate_path, mock_config):
+async def test_get_slide_text():
     handler = PPTXHandler("test.pptx")
-    mock_slide = MagicMock()
-    handler.presentation.slides = [mock_slide]
-
-    mock_shape = MagicMock()
-    mock_para = MagicMock()
-    mock_run = MagicMock()
-    mock_run.text = "Hello World"
-    mock_para.runs = [mock_run]
-    mock_shape.text_frame.paragraphs = [mock_para]
-    mock_slide.shapes = [mock_shape]
+    run = SimpleNamespace(text="Hello World")
+    shape = SimpleNamespace(text_frame=SimpleNamespace(paragraphs=[SimpleNamespace(runs=[run])]))
+    handler.presentation.slides = [make_slide(shapes=[shape])]
 
     text = await handler.get_slide_text(1)
     assert text == "Hello World"
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-async def test_get_notes(mock_pres_class, mock_validate_path, mock_config):
+async def test_get_notes():
     handler = PPTXHandler("test.pptx")
-    mock_slide = MagicMock()
-    mock_slide.has_notes_slide = True
-    mock_slide.notes_slide.notes_text_frame.text = "The note"
-    handler.presentation.slides = [mock_slide]
+    notes_slide = SimpleNamespace(notes_text_frame=SimpleNamespace(text="The note"))
+    handler.presentation.slides = [make_slide(has_notes_slide=True, notes_slide=notes_slide)]
 
     result = await handler.get_notes(1)
     assert result == {"slide": 1, "notes": "The note"}
 
 
-@patch("src.mcp_server.core.pptx_handler.Presentation")
-async def test_save(mock_pres_class, mock_validate_path, mock_config):
+async def test_save():
     handler = PPTXHandler("test.pptx")
     # Trigger lazy load
     mock_pres = handler.presentation
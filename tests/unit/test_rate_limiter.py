@@ -3,7 +3,7 @@
 import asyncio
 import pytest
 import time
-from unittest.mock import patch
+from dataclasses import replace
 
 from mcp_server.rate_limiter import (
     TokenBucketRateLimiter,
@@ -15,6 +15,30 @@ from mcp_server.rate_limiter import (
 from mcp_server.config import Config
 
 
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Default configuration shared by tests that only tweak performance settings."""
+    return Config()
+
+
+def with_performance(config, **changes):
+    """Copy a config with some performance settings replaced."""
+    return config.replace(performance=replace(config.performance, **changes))
+
+
 @pytest.fixture(autouse=True)
 def cleanup_rate_limiter():
     """Clean up global rate limiter after each test."""
@@ -60,20 +84,25 @@ class TestTokenBucketRateLimiter:
         assert limiter._tokens == 5.0
 
     @pytest.mark.asyncio
-    async def test_acquire_blocks_when_no_tokens(self):
+    async def test_acquire_blocks_when_no_tokens(self, monkeypatch):
         """Test that acquire blocks when tokens are exhausted."""
-        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=5)
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=5, time_source=clock)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock.tick(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
 
         # Exhaust all tokens
         await limiter.acquire(5)
+        assert sleeps == []
 
-        # Next acquire should block
-        start = time.monotonic()
+        # Next acquire should wait 0.1 seconds (1 token at 10/sec rate)
         await limiter.acquire(1)
-        elapsed = time.monotonic() - start
-
-        # Should wait at least 0.1 seconds (1 token at 10/sec rate)
-        assert elapsed >= 0.08  # Allow small margin
+        assert sleeps == [pytest.approx(0.1)]
 
     @pytest.mark.asyncio
     async def test_try_acquire_success(self):
@@ -107,29 +136,45 @@ class TestTokenBucketRateLimiter:
     @pytest.mark.asyncio
     async def test_tokens_refill_over_time(self):
         """Test that tokens are refilled over time."""
-        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=10)
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=10, time_source=clock)
 
         # Exhaust tokens
         await limiter.acquire(10)
         assert limiter._tokens == 0.0
 
         # Wait for tokens to refill
-        await asyncio.sleep(0.5)
-
-        # Should have ~5 tokens now (10 per second * 0.5 seconds)
-        available = limiter.get_available_tokens()
-        assert 4.0 <= available <= 6.0  # Allow some margin
-
-    @pytest.mark.asyncio
-    async def test_tokens_capped_at_burst(self):
+        clock.tick(0.5)
+
+        # 10 per second * 0.5 seconds
+        assert limiter.get_available_tokens() == pytest.approx(5.0)
+
+    @pytest.mark.parametrize(
+        "current,elapsed,rate_per_second,burst,expected",
+        [
+            (0.0, 0.5, 10.0, 10, 5.0),
+            (0.0, 2.0, 10.0, 5, 5.0),
+            (2.5, 0.0, 10.0, 10, 2.5),
+            (3.0, 0.25, 4.0, 10, 4.0),
+            (5.0, 1.0, 1 / 60, 60, 5.0 + 1 / 60),
+        ],
+        ids=["refill", "capped", "no_elapsed", "partial", "per_minute"],
+    )
+    def test_compute_new_tokens(self, current, elapsed, rate_per_second, burst, expected):
+        """Test the pure token refill computation."""
+        assert TokenBucketRateLimiter._compute_new_tokens(
+            current, elapsed, rate_per_second, burst
+        ) == pytest.approx(expected)
+
+    def test_tokens_capped_at_burst(self):
         """Test that tokens don't exceed burst limit."""
-        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=5)
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=5, time_source=clock)
 
         # Wait long enough to generate more than burst
-        await asyncio.sleep(1.0)
+        clock.tick(1.0)
 
-        available = limiter.get_available_tokens()
-        assert available <= 5.0
+        assert limiter.get_available_tokens() == 5.0
 
     def test_get_available_tokens(self):
         """Test getting available tokens."""
@@ -147,47 +192,42 @@ class TestTokenBucketRateLimiter:
 
     def test_get_wait_time_with_wait(self):
         """Test wait time calculation when tokens unavailable."""
-        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=5)
+        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=5, time_source=FakeClock())
         limiter._tokens = 0.0
 
-        wait_time = limiter.get_wait_time(5)
-        assert 0.4 <= wait_time <= 0.6  # ~0.5 seconds for 5 tokens at 10/sec
+        # 5 tokens at 10/sec
+        assert limiter.get_wait_time(5) == pytest.approx(0.5)
 
     @pytest.mark.asyncio
     async def test_concurrent_acquires(self):
         """Test that concurrent acquires are properly serialized."""
-        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=10)
-
-        async def acquire_tokens():
-            await limiter.acquire(3)
-            return limiter._tokens
+        limiter = TokenBucketRateLimiter(rate=10, per=1.0, burst=10, time_source=FakeClock())
 
         # Start multiple concurrent acquire operations
-        tasks = [acquire_tokens() for _ in range(3)]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(3):
+                tg.create_task(limiter.acquire(3))
 
         # After 3 acquires of 3 tokens each, should have 1 token left
-        # (or be in the process of refilling)
-        assert limiter._tokens <= 2.0
+        assert limiter._tokens == 1.0
 
 
 class TestRateLimiterMiddleware:
     """Tests for RateLimiterMiddleware."""
 
     @pytest.mark.asyncio
-    async def test_middleware_with_rate_limiting_disabled(self):
+    async def test_middleware_with_rate_limiting_disabled(self, monkeypatch, base_config):
         """Test that middleware passes through when rate limiting disabled."""
-        config = Config()
-        config.performance.enable_rate_limiting = False
+        config = with_performance(base_config, enable_rate_limiting=False)
 
-        with patch("mcp_server.rate_limiter.get_config", return_value=config):
-            middleware = RateLimiterMiddleware()
+        monkeypatch.setattr("mcp_server.rate_limiter.get_config", lambda: config)
+        middleware = RateLimiterMiddleware()
 
-            async def handler(name, args):
-                return {"result": "success"}
+        async def handler(name, args):
+            return {"result": "success"}
 
-            result = await middleware("test_tool", {}, handler)
-            assert result == {"result": "success"}
+        result = await middleware("test_tool", {}, handler)
+        assert result == {"result": "success"}
 
     @pytest.mark.asyncio
     async def test_middleware_allows_within_limit(self):
@@ -241,44 +281,41 @@ class TestRateLimiterMiddleware:
 class TestGlobalRateLimiter:
     """Tests for global rate limiter functions."""
 
-    def test_get_rate_limiter_with_enabled(self):
+    def test_get_rate_limiter_with_enabled(self, monkeypatch, base_config):
         """Test getting rate limiter when enabled in config."""
-        config = Config()
-        config.performance.enable_rate_limiting = True
-        config.performance.max_requests_per_minute = 60
+        config = with_performance(
+            base_config, enable_rate_limiting=True, max_requests_per_minute=60
+        )
 
-        with patch("mcp_server.rate_limiter.get_config", return_value=config):
-            limiter = get_rate_limiter()
-            assert limiter is not None
-            assert limiter.rate == 60
-            assert limiter.per == 60.0
+        monkeypatch.setattr("mcp_server.rate_limiter.get_config", lambda: config)
+        limiter = get_rate_limiter()
+        assert limiter is not None
+        assert limiter.rate == 60
+        assert limiter.per == 60.0
 
-    def test_get_rate_limiter_with_disabled(self):
+    def test_get_rate_limiter_with_disabled(self, monkeypatch, base_config):
         """Test getting rate limiter when disabled in config."""
-        config = Config()
-        config.performance.enable_rate_limiting = False
+        config = with_performance(base_config, enable_rate_limiting=False)
 
-        with patch("mcp_server.rate_limiter.get_config", return_value=config):
-            limiter = get_rate_limiter()
-            assert limiter is None
+        monkeypatch.setattr("mcp_server.rate_limiter.get_config", lambda: config)
+        limiter = get_rate_limiter()
+        assert limiter is None
 
-    def test_get_rate_limiter_singleton(self):
+    def test_get_rate_limiter_singleton(self, monkeypatch, base_config):
         """Test that get_rate_limiter returns same instance."""
-        config = Config()
-        config.performance.enable_rate_limiting = True
+        config = with_performance(base_config, enable_rate_limiting=True)
 
-        with patch("mcp_server.rate_limiter.get_config", return_value=config):
-            limiter1 = get_rate_limiter()
-            limiter2 = get_rate_limiter()
-            assert limiter1 is limiter2
+        monkeypatch.setattr("mcp_server.rate_limiter.get_config", lambda: config)
+        limiter1 = get_rate_limiter()
+        limiter2 = get_rate_limiter()
+        assert limiter1 is limiter2
 
-    def test_reset_rate_limiter(self):
+    def test_reset_rate_limiter(self, monkeypatch, base_config):
         """Test resetting global rate limiter."""
-        config = Config()
-        config.performance.enable_rate_limiting = True
-
-        with patch("mcp_server.rate_limiter.get_config", return_value=config):
-            limiter1 = get_rate_limiter()
-            reset_rate_limiter()
-            limiter2 = get_rate_limiter()
-            assert limiter1 is not limiter2
+        config = with_performance(base_config, enable_rate_limiting=True)
+
+        monkeypatch.setattr("mcp_server.rate_limiter.get_config", lambda: config)
+        limiter1 = get_rate_limiter()
+        reset_rate_limiter()
+        limiter2 = get_rate_limiter()
+        assert limiter1 is not limiter2
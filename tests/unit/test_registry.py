@@ -9,12 +9,38 @@ from mcp_server.tools.registry import (
 )
 
 
+async def empty_handler(arguments):
+    """Handler shared by tests that only care about registration."""
+    return {}
+
+
 @pytest.fixture
 def registry():
     """Create a fresh tool registry for testing."""
     return ToolRegistry()
 
 
+@pytest.fixture(scope="module")
+def populated_registry():
+    """Registry with a few tools registered through both registration APIs."""
+    populated = ToolRegistry()
+
+    @populated.register("add")
+    async def add_handler(arguments):
+        return {"result": arguments["a"] + arguments["b"]}
+
+    async def multiply_handler(arguments):
+        return {"result": arguments["a"] * arguments["b"]}
+
+    populated.register_handler("multiply", multiply_handler)
+
+    @populated.register("echo")
+    async def echo_handler(arguments):
+        return {"result": "success", "args": arguments}
+
+    return populated
+
+
 @pytest.fixture(autouse=True)
 def cleanup_global_registry():
     """Clean up global registry after each test."""
@@ -26,26 +52,18 @@ class TestToolRegistry:
     """Tests for ToolRegistry class."""
 
     @pytest.mark.asyncio
-    async def test_register_and_dispatch(self, registry):
-        """Test basic tool registration and dispatch."""
-
-        @registry.register("test_tool")
-        async def handler(arguments):
-            return {"result": "success", "args": arguments}
-
-        result = await registry.dispatch("test_tool", {"key": "value"})
-        assert result == {"result": "success", "args": {"key": "value"}}
-
-    @pytest.mark.asyncio
-    async def test_register_handler_method(self, registry):
-        """Test registering handler with register_handler method."""
-
-        async def handler(arguments):
-            return {"result": "ok"}
-
-        registry.register_handler("my_tool", handler)
-        result = await registry.dispatch("my_tool", {})
-        assert result == {"result": "ok"}
+    @pytest.mark.parametrize(
+        "name,args,expected",
+        [
+            ("add", {"a": 2, "b": 3}, {"result": 5}),
+            ("multiply", {"a": 2, "b": 3}, {"result": 6}),
+            ("echo", {"key": "value"}, {"result": "success", "args": {"key": "value"}}),
+        ],
+        ids=["add-decorator", "multiply-register_handler", "echo-decorator"],
+    )
+    async def test_dispatch(self, populated_registry, name, args, expected):
+        """Test dispatching to tools registered by decorator and by method."""
+        assert await populated_registry.dispatch(name, args) == expected
 
     @pytest.mark.asyncio
     async def test_dispatch_unknown_tool(self, registry):
@@ -55,24 +73,15 @@ class TestToolRegistry:
 
     def test_is_registered(self, registry):
         """Test checking if tool is registered."""
-
-        @registry.register("test_tool")
-        async def handler(arguments):
-            return {}
+        registry.register_handler("test_tool", empty_handler)
 
         assert registry.is_registered("test_tool")
         assert not registry.is_registered("other_tool")
 
     def test_get_registered_tools(self, registry):
         """Test getting list of registered tools."""
-
-        @registry.register("tool1")
-        async def handler1(arguments):
-            return {}
-
-        @registry.register("tool2")
-        async def handler2(arguments):
-            return {}
+        registry.register_handler("tool1", empty_handler)
+        registry.register_handler("tool2", empty_handler)
 
         tools = registry.get_registered_tools()
         assert len(tools) == 2
@@ -81,11 +90,7 @@ class TestToolRegistry:
 
     def test_unregister(self, registry):
         """Test unregistering a tool."""
-
-        @registry.register("test_tool")
-        async def handler(arguments):
-            return {}
-
+        registry.register_handler("test_tool", empty_handler)
         assert registry.is_registered("test_tool")
 
         registry.unregister("test_tool")
@@ -98,14 +103,8 @@ class TestToolRegistry:
 
     def test_clear(self, registry):
         """Test clearing all registered tools."""
-
-        @registry.register("tool1")
-        async def handler1(arguments):
-            return {}
-
-        @registry.register("tool2")
-        async def handler2(arguments):
-            return {}
+        registry.register_handler("tool1", empty_handler)
+        registry.register_handler("tool2", empty_handler)
 
         assert len(registry.get_registered_tools()) == 2
 
@@ -125,24 +124,6 @@ class TestToolRegistry:
 
         assert "already registered" in caplog.text.lower()
 
-    @pytest.mark.asyncio
-    async def test_multiple_tools(self, registry):
-        """Test registering and calling multiple tools."""
-
-        @registry.register("add")
-        async def add_handler(arguments):
-            return {"result": arguments["a"] + arguments["b"]}
-
-        @registry.register("multiply")
-        async def multiply_handler(arguments):
-            return {"result": arguments["a"] * arguments["b"]}
-
-        result1 = await registry.dispatch("add", {"a": 2, "b": 3})
-        assert result1 == {"result": 5}
-
-        result2 = await registry.dispatch("multiply", {"a": 2, "b": 3})
-        assert result2 == {"result": 6}
-
 
 class TestGlobalRegistry:
     """Tests for global tool registry functions."""
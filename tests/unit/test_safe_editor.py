@@ -1,8 +1,11 @@
-import pytest
+import io
 import zipfile
+import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 from lxml import etree
+from src.mcp_server.core import safe_editor
 from src.mcp_server.core.safe_editor import (
     _notes_part_for_slide,
     _set_notes_text,
@@ -12,32 +15,46 @@ from src.mcp_server.core.safe_editor import (
     _XML_NS,
 )
 
-
-def test_iter_updates_slides_list():
-    payload = {"slides": [{"slide": 1, "notes": "note 1"}, {"slide": 2, "notes": "note 2"}]}
-    expected = [(1, "note 1"), (2, "note 2")]
-    assert _iter_updates(payload) == expected
+_A_T = f"{{{_XML_NS['a']}}}t"
+_A_R = f"{{{_XML_NS['a']}}}r"
+_A_RPR = f"{{{_XML_NS['a']}}}rPr"
 
 
-def test_iter_updates_mapping():
-    payload = {"1": "note 1", "2": "note 2"}
-    expected = [(1, "note 1"), (2, "note 2")]
-    assert _iter_updates(payload) == expected
+def _iter_tag(xml_bytes, tag):
+    """Stream the elements with the given tag without building a full tree."""
+    for _, element in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag=tag):
+        yield element
 
 
-def test_iter_updates_invalid_payload():
-    with pytest.raises(ValueError, match="Invalid JSON"):
-        _iter_updates([1, 2, 3])
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"slides": [{"slide": 1, "notes": "note 1"}, {"slide": 2, "notes": "note 2"}]},
+        {"1": "note 1", "2": "note 2"},
+    ],
+    ids=["slides_list", "mapping"],
+)
+def test_iter_updates(payload):
+    assert _iter_updates(payload) == [(1, "note 1"), (2, "note 2")]
 
 
-def test_iter_updates_invalid_slide_no():
-    payload = {"abc": "note"}
-    with pytest.raises(ValueError, match="Invalid JSON mapping key"):
+@pytest.mark.parametrize(
+    "payload,match",
+    [
+        ([1, 2, 3], "Invalid JSON"),
+        ({"abc": "note"}, "Invalid JSON mapping key"),
+    ],
+    ids=["invalid_payload", "invalid_slide_no"],
+)
+def test_iter_updates_invalid(payload, match):
+    with pytest.raises(ValueError, match=match):
         _iter_updates(payload)
 
 
-def test_set_notes_text_basic():
-    notes_xml = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+@pytest.fixture(scope="module")
+def notes_xml_bytes():
+    """Encoded notes slide with a single body placeholder paragraph."""
+    return f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
     <p:notes xmlns:a="{_XML_NS['a']}" xmlns:p="{_XML_NS['p']}">
         <p:sp>
             <p:nvSpPr><p:nvPr><p:ph type="body"/></p:nvPr></p:nvSpPr>
@@ -49,35 +66,28 @@ def test_set_notes_text_basic():
     </p:notes>
     """.encode()
 
-    new_text = "New Note\nSecond Line"
-    updated_xml = _set_notes_text(notes_xml, new_text)
 
-    root = etree.fromstring(updated_xml)
-    paragraphs = root.xpath("//a:p", namespaces=_XML_NS)
-    assert len(paragraphs) == 2
-    assert paragraphs[0].find(".//a:t", namespaces=_XML_NS).text == "New Note"
-    assert paragraphs[1].find(".//a:t", namespaces=_XML_NS).text == "Second Line"
+@pytest.mark.parametrize(
+    "new_text,expected_paragraphs",
+    [
+        ("New Note\nSecond Line", ["New Note", "Second Line"]),
+        ("Single line", ["Single line"]),
+        ("A\r\nB\rC", ["A", "B", "C"]),
+    ],
+    ids=["two_lines", "single_line", "mixed_newlines"],
+)
+def test_set_notes_text_basic(notes_xml_bytes, new_text, expected_paragraphs):
+    updated_xml = _set_notes_text(notes_xml_bytes, new_text)
 
+    assert [t.text for t in _iter_tag(updated_xml, _A_T)] == expected_paragraphs
 
-def test_set_notes_text_bold_formatting():
-    notes_xml = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-    <p:notes xmlns:a="{_XML_NS['a']}" xmlns:p="{_XML_NS['p']}">
-        <p:sp>
-            <p:nvSpPr><p:nvPr><p:ph type="body"/></p:nvPr></p:nvSpPr>
-            <p:txBody><a:p><a:r><a:t>X</a:t></a:r></a:p></p:txBody>
-        </p:sp>
-    </p:notes>
-    """.encode()
 
+def test_set_notes_text_bold_formatting(notes_xml_bytes):
     new_text = "- Short version: Summary\n- Original: Full content"
-    updated_xml = _set_notes_text(notes_xml, new_text)
+    updated_xml = _set_notes_text(notes_xml_bytes, new_text)
 
-    root = etree.fromstring(updated_xml)
-    runs = root.xpath("//a:r", namespaces=_XML_NS)
-    assert len(runs) == 2
-    # Check for bold property <a:rPr b="1"/>
-    assert runs[0].find("a:rPr", namespaces=_XML_NS).get("b") == "1"
-    assert runs[1].find("a:rPr", namespaces=_XML_NS).get("b") == "1"
+    # Check for bold property <a:rPr b="1"/> on both runs
+    assert [r.find(_A_RPR).get("b") for r in _iter_tag(updated_xml, _A_R)] == ["1", "1"]
 
 
 def test_notes_part_for_slide_found():
@@ -93,58 +103,36 @@ def test_notes_part_for_slide_found():
         "    "
     ).encode()
 
-    mock_zip = MagicMock(spec=zipfile.ZipFile)
-    mock_zip.read.return_value = rels_content
+    fake_zip = SimpleNamespace(read=lambda name: rels_content)
 
-    part = _notes_part_for_slide(mock_zip, 1)
+    part = _notes_part_for_slide(fake_zip, 1)
     assert part == "ppt/notesSlides/notesSlide1.xml"
 
 
 def test_notes_part_for_slide_not_found():
-    mock_zip = MagicMock(spec=zipfile.ZipFile)
-    mock_zip.read.side_effect = KeyError()
+    def read(name):
+        raise KeyError(name)
 
-    part = _notes_part_for_slide(mock_zip, 1)
+    part = _notes_part_for_slide(SimpleNamespace(read=read), 1)
     assert part is None
 
 
-@patch("zipfile.ZipFile")
-def test_update_notes_safe(mock_zip_class):
-    mock_zin = MagicMock()
-    mock_zout = MagicMock()
-
-    # Use context manager
-    mock_zin.__enter__.return_value = mock_zin
-    mock_zout.__enter__.return_value = mock_zout
-
-    # Configure mock_zip_class
-    def zip_side_effect(file, mode, **kwargs):
-        if mode == "r":
-            return mock_zin
-        if mode == "w":
-            return mock_zout
-        return MagicMock()
-
-    mock_zip_class.side_effect = zip_side_effect
-
-    # Setup zin.infolist and zin.read
-    item = MagicMock()
-    item.filename = "ppt/slides/slide1.xml"
-    item.date_time = (2024, 1, 1, 0, 0, 0)
-    item.external_attr = 0
-    item.comment = b""
-    item.extra = b""
-    item.internal_attr = 0
-    item.create_system = 0
-    mock_zin.infolist.return_value = [item]
-    mock_zin.read.return_value = b"some content"
+def test_update_notes_safe(monkeypatch):
+    slide_xml = b"<p:sld/>"
+    src = io.BytesIO()
+    with zipfile.ZipFile(src, "w") as zf:
+        zf.writestr("ppt/slides/slide1.xml", slide_xml)
+    src.seek(0)
+    out = io.BytesIO()
 
     # No updates for this slide found in _notes_part_for_slide, should just copy
-    with patch("src.mcp_server.core.safe_editor._notes_part_for_slide", return_value=None):
-        update_notes_safe(Path("in.pptx"), [(1, "new note")], Path("out.pptx"))
+    monkeypatch.setattr(safe_editor, "_notes_part_for_slide", lambda zin, slide_no: None)
+    update_notes_safe(src, [(1, "new note")], out)
 
-    # Check if zout.writestr was called to copy the slide
-    mock_zout.writestr.assert_called()
+    out.seek(0)
+    with zipfile.ZipFile(out) as zf:
+        assert zf.namelist() == ["ppt/slides/slide1.xml"]
+        assert zf.read("ppt/slides/slide1.xml") == slide_xml
 
 
 @patch("src.mcp_server.core.safe_editor.update_notes_safe")
@@ -1,5 +1,4 @@
 import json
-import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -12,13 +11,27 @@ from src.mcp_server.tools.registry import reset_tool_registry
 from src.mcp_server.utils.validators import validate_output_json_path
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_registry():
-    reset_tool_registry()
+    """Drop the tools registered by a test; re-registering over them is idempotent."""
     yield
     reset_tool_registry()
 
 
+def _patch_server_state(monkeypatch, audio_readiness):
+    """Reset server readiness globals and stub the readiness checks."""
+    state = {
+        "_foundry_ready": False,
+        "_foundry_reason": None,
+        "_audio_ready": False,
+        "_audio_reason": None,
+        "check_foundry_readiness": lambda: (False, "skip"),
+        "check_audio_transcribe_readiness": lambda: audio_readiness,
+    }
+    for name, value in state.items():
+        monkeypatch.setattr(server, name, value)
+
+
 def test_validate_output_json_path_enforces_workspace(monkeypatch, tmp_path):
     workspace_dir = tmp_path / "workspace"
     workspace_dir.mkdir()
@@ -42,13 +55,8 @@ def test_validate_output_json_path_enforces_workspace(monkeypatch, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_transcript_tool_not_listed_when_audio_unready(monkeypatch):
-    monkeypatch.setattr(server, "_foundry_ready", False)
-    monkeypatch.setattr(server, "_foundry_reason", None)
-    monkeypatch.setattr(server, "_audio_ready", False)
-    monkeypatch.setattr(server, "_audio_reason", None)
-    monkeypatch.setattr(server, "check_foundry_readiness", lambda: (False, "skip"))
-    monkeypatch.setattr(server, "check_audio_transcribe_readiness", lambda: (False, "missing"))
+async def test_transcript_tool_not_listed_when_audio_unready(monkeypatch, reset_registry):
+    _patch_server_state(monkeypatch, audio_readiness=(False, "missing"))
 
     server.register_all_tools()
     tools = await server.list_tools()
@@ -56,13 +64,8 @@ async def test_transcript_tool_not_listed_when_audio_unready(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_transcript_tool_listed_when_audio_ready(monkeypatch):
-    monkeypatch.setattr(server, "_foundry_ready", False)
-    monkeypatch.setattr(server, "_foundry_reason", None)
-    monkeypatch.setattr(server, "_audio_ready", False)
-    monkeypatch.setattr(server, "_audio_reason", None)
-    monkeypatch.setattr(server, "check_foundry_readiness", lambda: (False, "skip"))
-    monkeypatch.setattr(server, "check_audio_transcribe_readiness", lambda: (True, None))
+async def test_transcript_tool_listed_when_audio_ready(monkeypatch, reset_registry):
+    _patch_server_state(monkeypatch, audio_readiness=(True, None))
 
     server.register_all_tools()
     tools = await server.list_tools()
@@ -70,19 +73,7 @@ async def test_transcript_tool_listed_when_audio_ready(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_handle_transcribe_embedded_video_audio_uses_mocks(tmp_path, monkeypatch):
-    pptx_path = tmp_path / "demo.pptx"
-    slide_rels = """<?xml version="1.0" encoding="UTF-8"?>
-    <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-        <Relationship Id="rId1" Type="http://schemas.microsoft.com/office/2007/relationships/media" Target="../media/video1.mp4"/>
-    </Relationships>
-    """
-
-    with zipfile.ZipFile(pptx_path, "w") as archive:
-        archive.writestr("ppt/slides/slide1.xml", "<p:sld xmlns:p='http://schemas.openxmlformats.org/presentationml/2006/main'></p:sld>")  # noqa: E501
-        archive.writestr("ppt/slides/_rels/slide1.xml.rels", slide_rels)
-        archive.writestr("ppt/media/video1.mp4", b"video-bytes")
-
+async def test_handle_transcribe_embedded_video_audio_uses_mocks(minimal_video_pptx, monkeypatch):
     def fake_extract(video_path: Path, out_wav_path: Path, **kwargs):
         out_wav_path.parent.mkdir(parents=True, exist_ok=True)
         out_wav_path.write_bytes(b"wav-bytes")
@@ -95,7 +86,7 @@ async def test_handle_transcribe_embedded_video_audio_uses_mocks(tmp_path, monke
     monkeypatch.setattr(transcript_tools, "transcribe_audio_file", fake_transcribe)
 
     result = await transcript_tools.handle_transcribe_embedded_video_audio(
-        {"pptx_path": str(pptx_path), "slide_numbers": [1], "include_raw_response": True}
+        {"pptx_path": str(minimal_video_pptx), "slide_numbers": [1], "include_raw_response": True}
     )
 
     assert result["success"] is True
@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from src.mcp_server.utils import validators
 from src.mcp_server.utils.validators import (
     _is_path_safe,
     _check_workspace_boundary,
@@ -23,19 +24,46 @@ from src.mcp_server.exceptions import (
     InputTooLargeError,
 )
 
+WORKSPACE_DIR = Path("/tmp/workspace").resolve()
+
+
+def _raises_with(exc, sub, fn, *args, **kwargs):
+    """Assert fn raises exc with sub in its message, without pytest.raises regex matching."""
+    try:
+        fn(*args, **kwargs)
+    except exc as e:
+        assert sub in str(e)
+    else:
+        pytest.fail(f"{fn.__name__} did not raise {exc.__name__}")
+
+
+class _StubPath:
+    """Existing file of a fixed size, exposing only what _check_file_size reads."""
+
+    def __init__(self, size):
+        self._stat = SimpleNamespace(st_size=size)
+
+    def exists(self):
+        return True
+
+    def stat(self):
+        return self._stat
+
 
 @pytest.fixture
-def mock_config():
-    with patch("src.mcp_server.utils.validators.get_config") as mock:
-        config = MagicMock()
-        config.security.enforce_workspace_boundary = True
-        config.security.workspace_dirs = [Path("/tmp/workspace").resolve()]
-        config.security.max_file_size = 10 * 1024 * 1024  # 10MB
-        config.security.max_path_length = 255
-        config.security.allowed_extensions = [".pptx"]
-        config.security.max_text_length = 1000
-        mock.return_value = config
-        yield config
+def mock_config(monkeypatch):
+    config = SimpleNamespace(
+        security=SimpleNamespace(
+            enforce_workspace_boundary=True,
+            workspace_dirs=[WORKSPACE_DIR],
+            max_file_size=10 * 1024 * 1024,  # 10MB
+            max_path_length=255,
+            allowed_extensions=[".pptx"],
+            max_text_length=1000,
+        )
+    )
+    monkeypatch.setattr(validators, "get_config", lambda: config)
+    return config
 
 
 def test_is_path_safe():
@@ -44,11 +72,12 @@ def test_is_path_safe():
     # but we can't easily trigger OSError/RuntimeError for resolve() without mocking
 
 
-def test_check_workspace_boundary_within(mock_config):
+def test_check_workspace_boundary_within(mock_config, monkeypatch):
     path = Path("/tmp/workspace/test.pptx")
-    with patch.object(Path, "resolve", return_value=path.resolve()):
-        # Should not raise
-        _check_workspace_boundary(path)
+    resolved = path.resolve()
+    monkeypatch.setattr(Path, "resolve", lambda self: resolved)
+    # Should not raise
+    _check_workspace_boundary(path)
 
 
 def test_check_workspace_boundary_outside(mock_config):
@@ -65,47 +94,39 @@ def test_check_workspace_boundary_disabled(mock_config):
 
 
 def test_check_file_size_within(mock_config):
-    path = MagicMock(spec=Path)
-    path.exists.return_value = True
-    path.stat.return_value.st_size = 5 * 1024 * 1024
     # Should not raise
-    _check_file_size(path)
+    _check_file_size(_StubPath(5 * 1024 * 1024))
 
 
 def test_check_file_size_exceeds(mock_config):
-    path = MagicMock(spec=Path)
-    path.exists.return_value = True
-    path.stat.return_value.st_size = 15 * 1024 * 1024
     with pytest.raises(FileTooLargeError):
-        _check_file_size(path)
+        _check_file_size(_StubPath(15 * 1024 * 1024))
 
 
-def test_validate_pptx_path_success(mock_config):
+def test_validate_pptx_path_success(mock_config, monkeypatch):
     path_str = "/tmp/workspace/presentation.pptx"
     path_obj = Path(path_str)
 
-    with (
-        patch("src.mcp_server.utils.validators._is_path_safe", return_value=True),
-        patch.object(Path, "exists", return_value=True),
-        patch.object(Path, "resolve", return_value=path_obj),
-        patch("src.mcp_server.utils.validators._check_file_size"),
-    ):
+    monkeypatch.setattr(validators, "_is_path_safe", lambda path: True)
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    monkeypatch.setattr(Path, "resolve", lambda self: path_obj)
+    monkeypatch.setattr(validators, "_check_file_size", lambda path: None)
 
-        result = validate_pptx_path(path_str)
-        assert isinstance(result, Path)
-        assert str(result).endswith("presentation.pptx")
+    result = validate_pptx_path(path_str)
+    assert isinstance(result, Path)
+    assert str(result).endswith("presentation.pptx")
 
 
-def test_validate_pptx_path_invalid_extension(mock_config):
+def test_validate_pptx_path_invalid_extension(mock_config, monkeypatch):
     path_str = "/tmp/workspace/presentation.txt"
-    with (
-        patch("src.mcp_server.utils.validators._is_path_safe", return_value=True),
-        patch.object(Path, "exists", return_value=True),
-        patch.object(Path, "resolve", return_value=Path(path_str)),
-    ):
+    path_obj = Path(path_str)
+
+    monkeypatch.setattr(validators, "_is_path_safe", lambda path: True)
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    monkeypatch.setattr(Path, "resolve", lambda self: path_obj)
 
-        with pytest.raises(InvalidPathError, match="Invalid file extension"):
-            validate_pptx_path(path_str)
+    with pytest.raises(InvalidPathError, match="Invalid file extension"):
+        validate_pptx_path(path_str)
 
 
 def test_validate_slide_number():
@@ -115,25 +136,48 @@ def test_validate_slide_number():
         validate_slide_number(0, 10)
     with pytest.raises(InvalidSlideNumberError):
         validate_slide_number(11, 10)
-    with pytest.raises(ValidationError, match="integer"):
-        validate_slide_number("1", 10)
+    _raises_with(ValidationError, "integer", validate_slide_number, "1", 10)
+
 
+@pytest.mark.parametrize(
+    "position,expected",
+    [
+        ({"x": 10.0, "y": 20.0}, {"x": 10.0, "y": 20.0}),
+        (None, {"x": 0.0, "y": 0.0}),
+        ({"x": 10}, {"x": 10.0, "y": 0.0}),
+    ],
+    ids=["explicit", "default", "partial"],
+)
+def test_validate_position(position, expected):
+    assert validate_position(position) == expected
 
-def test_validate_position():
-    assert validate_position({"x": 10.0, "y": 20.0}) == {"x": 10.0, "y": 20.0}
-    assert validate_position(None) == {"x": 0.0, "y": 0.0}
-    assert validate_position({"x": 10}) == {"x": 10.0, "y": 0.0}
-    with pytest.raises(ValueError, match="dictionary"):
-        validate_position([10, 20])
-    with pytest.raises(ValueError, match="numbers"):
-        validate_position({"x": "10"})
 
+@pytest.mark.parametrize(
+    "position,message",
+    [
+        ([10, 20], "dictionary"),
+        ({"x": "10"}, "numbers"),
+    ],
+    ids=["not_dict", "not_number"],
+)
+def test_validate_position_invalid(position, message):
+    _raises_with(ValueError, message, validate_position, position)
 
-def test_validate_size():
-    assert validate_size({"width": 100.0, "height": 200.0}) == {"width": 100.0, "height": 200.0}
-    assert validate_size(None) == {"width": 100.0, "height": 100.0}
-    with pytest.raises(ValueError, match="positive"):
-        validate_size({"width": 0, "height": 100})
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [
+        ({"width": 100.0, "height": 200.0}, {"width": 100.0, "height": 200.0}),
+        (None, {"width": 100.0, "height": 100.0}),
+    ],
+    ids=["explicit", "default"],
+)
+def test_validate_size(size, expected):
+    assert validate_size(size) == expected
+
+
+def test_validate_size_invalid():
+    _raises_with(ValueError, "positive", validate_size, {"width": 0, "height": 100})
 
 
 def test_validate_text_input(mock_config):
@@ -145,25 +189,36 @@ def test_validate_text_input(mock_config):
         validate_text_input(123)
 
 
-def test_parse_slide_range():
-    assert parse_slide_range("1-5") == [1, 2, 3, 4, 5]
-    assert parse_slide_range(" 1 - 3 ") == [1, 2, 3]
-    with pytest.raises(ValueError, match="format"):
-        parse_slide_range("1:5")
-    with pytest.raises(ValueError, match="numbers"):
-        parse_slide_range("a-b")
-    with pytest.raises(ValueError, match="must be >= start"):
-        parse_slide_range("5-1")
-    with pytest.raises(ValueError, match="must be >= 1"):
-        parse_slide_range("0-5")
+@pytest.mark.parametrize(
+    "slide_range,expected",
+    [
+        ("1-5", [1, 2, 3, 4, 5]),
+        (" 1 - 3 ", [1, 2, 3]),
+    ],
+    ids=["plain", "whitespace"],
+)
+def test_parse_slide_range(slide_range, expected):
+    assert parse_slide_range(slide_range) == expected
+
+
+@pytest.mark.parametrize(
+    "slide_range,message",
+    [
+        ("1:5", "format"),
+        ("a-b", "numbers"),
+        ("5-1", "must be >= start"),
+        ("0-5", "must be >= 1"),
+    ],
+    ids=["bad_separator", "not_numbers", "reversed", "below_one"],
+)
+def test_parse_slide_range_invalid(slide_range, message):
+    _raises_with(ValueError, message, parse_slide_range, slide_range)
 
 
 def test_validate_slide_numbers():
     assert validate_slide_numbers([1, 2, 3], 10) == [1, 2, 3]
-    with pytest.raises(ValueError, match="empty"):
-        validate_slide_numbers([], 10)
-    with pytest.raises(ValueError, match="integers"):
-        validate_slide_numbers([1, "2"], 10)
+    _raises_with(ValueError, "empty", validate_slide_numbers, [], 10)
+    _raises_with(ValueError, "integers", validate_slide_numbers, [1, "2"], 10)
 
 
 def test_validate_batch_updates():
@@ -173,9 +228,18 @@ def test_validate_batch_updates():
     ]
     assert validate_batch_updates(updates, 10) == updates
 
-    with pytest.raises(ValueError, match="empty"):
-        validate_batch_updates([], 10)
-    with pytest.raises(ValueError, match="missing required field 'slide_number'"):
-        validate_batch_updates([{"notes_text": "hello"}], 10)
-    with pytest.raises(ValueError, match="notes_text must be string"):
-        validate_batch_updates([{"slide_number": 1, "notes_text": 123}], 10)
+    _raises_with(ValueError, "empty", validate_batch_updates, [], 10)
+    _raises_with(
+        ValueError,
+        "missing required field 'slide_number'",
+        validate_batch_updates,
+        [{"notes_text": "hello"}],
+        10,
+    )
+    _raises_with(
+        ValueError,
+        "notes_text must be string",
+        validate_batch_updates,
+        [{"slide_number": 1, "notes_text": 123}],
+        10,
+    )